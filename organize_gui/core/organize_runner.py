@@ -18,6 +18,9 @@ from pathlib import Path
 # Import the parser function
 from .output_parser import parse_organize_output
 
+# Seconds to wait for a graceful stop before the process is killed
+KILL_WAIT_TIMEOUT = 1.0
+
 class OrganizeRunner:
     """Enhanced runner for the organize-tool."""
 
@@ -254,7 +257,7 @@ class OrganizeRunner:
 
             # Wait briefly for graceful shutdown
             try:
-                self.current_process.wait(timeout=1.0)
+                self.current_process.wait(timeout=KILL_WAIT_TIMEOUT)
                 print("Process terminated gracefully.")
                 message = "Process terminated gracefully."
             except subprocess.TimeoutExpired:
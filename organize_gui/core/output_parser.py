@@ -2,14 +2,266 @@
 Utility function for parsing the output stream of the organize-tool process.
 """
 
+import codecs
 import re
+import sys
+from collections.abc import Sequence
+
+# Maximum number of bytes taken from a pipe-backed stdout per read
+_READ_CHUNK_SIZE = 65536
+
+# Non-blank lines between checks of the stop flag (it is also checked at every Rule header)
+_RUNNING_CHECK_INTERVAL = 64
+
+# Line classification pattern, compiled once at import. A single alternation
+# classifies a line in one pass: the name of the outer group that matched
+# (Match.lastgroup) is the kind of line, with 'other' for any other non-blank line.
+# Action lines must be indented. Whitespace is written as [^\S\n] so a match never
+# runs past the end of a line, which lets _BLOCK_RE scan many lines at once.
+_LINE_PATTERN = r'''
+    ^(?:
+        (?P<rule>[^\S\n]*Rule[^\S\n]+"(?P<rule_name>[^"\n]+)".*)
+      | (?P<file>[^\S\n]*[✓✗][^\S\n]+(?P<file_path>\S.*))
+      | (?P<transfer>[^\S\n]+(?P<transfer_verb>Moving|Would\ move|Copying|Would\ copy|Renaming|Would\ rename)
+            [^\S\n]+"?[^"\n]+"?[^\S\n]+to[^\S\n]+"?(?P<transfer_dest>[^"\n]+)"?.*)
+      | (?P<delete>[^\S\n]+(?P<delete_verb>Deleting|Would\ delete)[^\S\n]+"?[^"\n]+"?.*)
+      | (?P<skipped>[^\S\n]+Skipped.*)
+      | (?P<error>[^\S\n]*(?i:error):.*)
+      | (?P<echo>[^\S\n]+echo:.*)
+      | (?P<other>.*\S.*)
+    )
+'''
+_LINE_RE = re.compile(_LINE_PATTERN, re.VERBOSE)
+# The same pattern over a block of lines: finditer() yields one match per non-blank line
+_BLOCK_RE = re.compile(_LINE_PATTERN, re.VERBOSE | re.MULTILINE)
+
+# Action verb -> (result status, output tag); only the verbs of the current mode are recognised
+_ACTION_VERBS = {
+    False: {
+        'Moving': ("Moved", "move"),
+        'Copying': ("Copied", "copy"),
+        'Renaming': ("Renamed", "rename"),
+        'Deleting': ("Deleted", "delete"),
+    },
+    True: {
+        'Would move': ("Would move", "move"),
+        'Would copy': ("Would copy", "copy"),
+        'Would rename': ("Would rename", "rename"),
+        'Would delete': ("Would delete", "delete"),
+    },
+}
+
+# Destination placeholder for rows that carry no 'destination' key (errors)
+_NO_DESTINATION = object()
+
+class ParsedResults(Sequence):
+    """
+    Results of one parse, stored as parallel columns.
+
+    Indexing or iterating builds the familiar result dict ('source', 'destination',
+    'status', 'rule') on demand, and a ParsedResults compares equal to the matching
+    list of dicts. Code that only needs some fields can read the sources,
+    destinations, statuses and rules lists directly and skip building rows.
+    """
+
+    __slots__ = ('sources', 'destinations', 'statuses', 'rules')
+
+    def __init__(self):
+        self.sources = []
+        self.destinations = [] # None for deletes/skips, _NO_DESTINATION for errors
+        self.statuses = []
+        self.rules = []
+
+    def append(self, source, destination, status, rule):
+        """Add one result row."""
+        self.sources.append(source)
+        self.destinations.append(destination)
+        self.statuses.append(status)
+        self.rules.append(rule)
+
+    def _row(self, index):
+        destination = self.destinations[index]
+        if destination is _NO_DESTINATION:
+            return {'source': self.sources[index], 'status': self.statuses[index], 'rule': self.rules[index]}
+        return {'source': self.sources[index], 'destination': destination, 'status': self.statuses[index], 'rule': self.rules[index]}
+
+    def __len__(self):
+        return len(self.sources)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        if index < 0: index += len(self)
+        if not 0 <= index < len(self): raise IndexError("result index out of range")
+        return self._row(index)
+
+    def __iter__(self):
+        return map(self._row, range(len(self)))
+
+    def __eq__(self, other):
+        if isinstance(other, (list, ParsedResults)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"ParsedResults({list(self)!r})"
+
+# Parser states: outside any file, or after a ✓/✗ line has named the current source file
+_S_ROOT, _S_AFTER_TICK = 0, 1
+
+class _ParseState:
+    """Mutable state shared by the line handlers during one parse."""
+
+    __slots__ = ('results', 'action_verbs', 'output_callback', 'progress_callback',
+                 'processed_files', 'current_rule', 'current_source_file', 'state')
+
+    def __init__(self, simulation, output_callback, progress_callback):
+        self.results = ParsedResults()
+        self.action_verbs = _ACTION_VERBS[bool(simulation)]
+        self.output_callback = output_callback
+        self.progress_callback = progress_callback
+        self.processed_files = 0
+        self.current_rule = ""
+        self.current_source_file = None # Track the file associated with the last ✓/✗
+        self.state = _S_ROOT
+
+    def add_result(self, status, destination=None):
+        """Record a result for the current source file and clear the file context."""
+        self.results.append(self.current_source_file, destination, status, self.current_rule)
+        self.current_source_file = None
+        self.state = _S_ROOT
+
+# Line handlers: each takes (state, match, line_strip), may move the parser to another
+# state and returns the output tag, or None if the line should not be passed to output_callback.
+
+def _handle_rule(state, match, line_strip):
+    # Intern the name so every row of a rule, even across repeated headers, shares one string
+    state.current_rule = sys.intern(match.group('rule_name'))
+    # Do NOT reset current_source_file here, wait for action or next file
+    return "heading"
+
+def _handle_file(state, match, line_strip):
+    state.processed_files += 1
+    state.current_source_file = match.group('file_path').strip() # Store the source file path
+    state.state = _S_AFTER_TICK
+    # Log processing message internally, don't show raw ✓/✗ line
+    if state.output_callback: state.output_callback(f"Processing: {state.current_source_file}", "info")
+    if state.progress_callback:
+        # Estimate progress (this is very approximate)
+        processed_files = state.processed_files
+        progress = min(processed_files / max(1, processed_files + 50) * 100, 98)
+        state.progress_callback(progress, f"Processed {processed_files} files...")
+    return None
+
+def _handle_root_other(state, match, line_strip):
+    lowered = line_strip.lower()
+    if "simulating" in lowered or "simulation" in lowered:
+        return "heading"
+    # Fallback for lines not matching specific patterns but maybe useful info
+    return "info"
+
+def _handle_info(state, match, line_strip):
+    # If an indented line doesn't match known patterns, treat as info
+    # Don't reset current_source_file here, might be multi-line info
+    return "info"
+
+def _handle_transfer(state, match, line_strip):
+    action = state.action_verbs.get(match.group('transfer_verb'))
+    if not action: return "info" # A verb of the other mode
+    status, tag = action
+    # Source might differ slightly if rename happened before move? Use stored one.
+    # For rename the destination is the new name/path
+    state.add_result(status, match.group('transfer_dest'))
+    return tag
+
+def _handle_delete(state, match, line_strip):
+    action = state.action_verbs.get(match.group('delete_verb'))
+    if not action: return "info" # A verb of the other mode
+    status, tag = action
+    state.add_result(status)
+    return tag
+
+def _handle_skipped(state, match, line_strip):
+    state.add_result("Skipped")
+    return "skipped"
+
+def _handle_file_error(state, match, line_strip):
+    # Handle errors associated with the current file
+    state.add_result("Error", _NO_DESTINATION)
+    return "error"
+
+def _handle_error(state, match, line_strip):
+    # Global errors not tied to a specific file are only logged
+    return "error"
+
+def _handle_echo(state, match, line_strip):
+    # Don't add echo to results, just log it
+    state.current_source_file = None
+    state.state = _S_ROOT
+    return "echo"
+
+# Parser state -> line kind (Match.lastgroup of _LINE_RE) -> handler
+_LINE_HANDLERS = (
+    { # _S_ROOT: action lines without a source file are only logged
+        'rule': _handle_rule,
+        'file': _handle_file,
+        'transfer': _handle_root_other,
+        'delete': _handle_root_other,
+        'skipped': _handle_root_other,
+        'error': _handle_error,
+        'echo': _handle_root_other,
+        'other': _handle_root_other,
+    },
+    { # _S_AFTER_TICK
+        'rule': _handle_rule,
+        'file': _handle_file,
+        'transfer': _handle_transfer,
+        'delete': _handle_delete,
+        'skipped': _handle_skipped,
+        'error': _handle_file_error,
+        'echo': _handle_echo,
+        'other': _handle_info,
+    },
+)
+
+def _iter_line_matches(stream):
+    """
+    Yield a _LINE_RE match for every non-blank line of an output stream.
+
+    Text streams backed by a binary buffer (a subprocess pipe opened with text=True)
+    are read in blocks with buffer.read1(), which returns whatever is available
+    rather than waiting for a full block, and each block of whole lines is classified
+    with a single _BLOCK_RE.finditer() scan. Any other iterable, such as the list
+    iterators used in tests, is matched line by line.
+    """
+    read1 = getattr(getattr(stream, 'buffer', None), 'read1', None)
+    if read1 is None:
+        match_line = _LINE_RE.match
+        for line in stream:
+            match = match_line(line)
+            if match: yield match # No match means a blank line
+        return
+
+    decoder = codecs.getincrementaldecoder(getattr(stream, 'encoding', None) or 'utf-8')(
+        errors=getattr(stream, 'errors', None) or 'strict')
+    tail = "" # Partial last line carried over to the next block
+    while True:
+        block = read1(_READ_CHUNK_SIZE)
+        text = tail + decoder.decode(block, final=not block)
+        if block:
+            cut = max(text.rfind('\n'), text.rfind('\r')) + 1
+            text, tail = text[:cut], text[cut:]
+        # Universal newlines, as text-mode iteration would give
+        yield from _BLOCK_RE.finditer(text.replace('\r\n', '\n').replace('\r', '\n'))
+        if not block:
+            break
 
 def parse_organize_output(stdout_stream, stderr_stream, is_running_flag_func, output_callback, progress_callback, simulation):
     """
     Parses stdout and stderr streams from the organize process.
 
     Args:
-        stdout_stream: The process's stdout stream iterator.
+        stdout_stream: The process's stdout stream (a text pipe or any iterator of lines).
         stderr_stream: The process's stderr stream iterator.
         is_running_flag_func (callable): A function that returns True if the process should continue running.
         output_callback (callable): Function to call with output text (text, tag).
@@ -17,131 +269,27 @@ def parse_organize_output(stdout_stream, stderr_stream, is_running_flag_func, ou
         simulation (bool): Whether this was a simulation run.
 
     Returns:
-        list: A list of result dictionaries extracted from the output.
+        ParsedResults: The results extracted from the output, usable as a list of result dictionaries.
     """
-    results = []
-    # Regex patterns
-    file_pattern = re.compile(r'^\s*[✓✗]\s+(.*)') # Matches the line indicating a file is being processed
-    rule_pattern = re.compile(r'^\s*Rule\s+"([^"]+)"')
-    # Action patterns (match the indented line following a file line)
-    move_pattern = re.compile(r'^\s+Moving\s+"?([^"]+)"?\s+to\s+"?([^"]+)"?')
-    would_move_pattern = re.compile(r'^\s+Would move\s+"?([^"]+)"?\s+to\s+"?([^"]+)"?')
-    copy_pattern = re.compile(r'^\s+Copying\s+"?([^"]+)"?\s+to\s+"?([^"]+)"?')
-    would_copy_pattern = re.compile(r'^\s+Would copy\s+"?([^"]+)"?\s+to\s+"?([^"]+)"?') # Added for simulation
-    rename_pattern = re.compile(r'^\s+Renaming\s+"?([^"]+)"?\s+to\s+"?([^"]+)"?')
-    would_rename_pattern = re.compile(r'^\s+Would rename\s+"?([^"]+)"?\s+to\s+"?([^"]+)"?') # Added for simulation
-    delete_pattern = re.compile(r'^\s+Deleting\s+"?([^"]+)"?')
-    would_delete_pattern = re.compile(r'^\s+Would delete\s+"?([^"]+)"?') # Added for simulation
-    skipped_pattern = re.compile(r'^\s+Skipped\s*(?:\((.*)\))?') # Capture optional reason
-    error_pattern = re.compile(r'^\s*Error:.*', re.IGNORECASE)
-    echo_pattern = re.compile(r'^\s+echo:\s*(.*)')
-
-    processed_files = 0
-    current_rule = ""
-    current_source_file = None # Track the file associated with the last ✓/✗
+    state = _ParseState(simulation, output_callback, progress_callback)
 
     # Process stdout line by line if the stream exists and is iterable
     if stdout_stream is not None:
         try:
-            for line in stdout_stream:
-                if not is_running_flag_func(): break # Check stop flag
-
-                line_strip = line.strip()
-                if not line_strip: continue
-                
-                tag = "info" # Default tag
-                log_line = True # Whether to pass the line to output_callback
-
-                rule_match = rule_pattern.match(line_strip)
-                file_match = file_pattern.match(line_strip)
-                error_match = error_pattern.match(line_strip) # Check for global errors first
-
-                if rule_match:
-                    current_rule = rule_match.group(1)
-                    # Do NOT reset current_source_file here, wait for action or next file
-                    tag = "heading"
-                elif file_match:
-                    processed_files += 1
-                    current_source_file = file_match.group(1) # Store the source file path
-                    # Log processing message internally, don't show raw ✓/✗ line
-                    if output_callback: output_callback(f"Processing: {current_source_file}", "info")
-                    if progress_callback:
-                        # Estimate progress (this is very approximate)
-                        progress = min(processed_files / max(1, processed_files + 50) * 100, 98)
-                        progress_callback(progress, f"Processed {processed_files} files...")
-                    log_line = False # Don't log the raw ✓/✗ line itself
-                elif current_source_file: # Only process action lines if we have a source file context
-                    # Check for specific actions/statuses
-                    move_match = move_pattern.match(line) if not simulation else None
-                    would_move_match = would_move_pattern.match(line) if simulation else None
-                    copy_match = copy_pattern.match(line) if not simulation else None
-                    would_copy_match = would_copy_pattern.match(line) if simulation else None
-                    rename_match = rename_pattern.match(line) if not simulation else None
-                    would_rename_match = would_rename_pattern.match(line) if simulation else None
-                    delete_match = delete_pattern.match(line) if not simulation else None
-                    would_delete_match = would_delete_pattern.match(line) if simulation else None
-                    skipped_match = skipped_pattern.match(line)
-                    echo_match = echo_pattern.match(line)
-                    # Check error again for action-specific errors
-                    action_error_match = error_pattern.match(line_strip)
-
-                    if move_match or would_move_match:
-                        match = move_match or would_move_match
-                        # Source might differ slightly if rename happened before move? Use stored one.
-                        dest = match.group(2)
-                        status = "Moved" if not simulation else "Would move"
-                        results.append({'source': current_source_file, 'destination': dest, 'status': status, 'rule': current_rule})
-                        tag = "move"
-                        current_source_file = None # Reset after processing action
-                    elif copy_match or would_copy_match:
-                        match = copy_match or would_copy_match
-                        dest = match.group(2)
-                        status = "Copied" if not simulation else "Would copy"
-                        results.append({'source': current_source_file, 'destination': dest, 'status': status, 'rule': current_rule})
-                        tag = "copy"
-                        current_source_file = None # Reset after processing action
-                    elif rename_match or would_rename_match:
-                        match = rename_match or would_rename_match
-                        dest = match.group(2) # Destination is the new name/path
-                        status = "Renamed" if not simulation else "Would rename"
-                        results.append({'source': current_source_file, 'destination': dest, 'status': status, 'rule': current_rule})
-                        tag = "rename"
-                        current_source_file = None # Reset after processing action
-                    elif delete_match or would_delete_match:
-                        match = delete_match or would_delete_match
-                        status = "Deleted" if not simulation else "Would delete"
-                        results.append({'source': current_source_file, 'destination': None, 'status': status, 'rule': current_rule})
-                        tag = "delete"
-                        current_source_file = None # Reset after processing action
-                    elif skipped_match:
-                        status = "Skipped"
-                        # reason = skipped_match.group(1) # Optional reason
-                        results.append({'source': current_source_file, 'destination': None, 'status': status, 'rule': current_rule})
-                        tag = "skipped"
-                        current_source_file = None # Reset after processing action
-                    elif action_error_match: # Handle errors associated with the current file
-                        tag = "error"
-                        results.append({'source': current_source_file, 'status': "Error", 'rule': current_rule})
-                        current_source_file = None # Reset after processing action
-                    elif echo_match:
-                        tag = "echo"
-                        # Don't add echo to results, just log it
-                        current_source_file = None # Reset after processing action
-                    else:
-                        # If an indented line doesn't match known patterns, treat as info
-                        tag = "info"
-                        # Don't reset current_source_file here, might be multi-line info
-                elif error_match: # Handle global errors not tied to a specific file
-                     tag = "error"
-                     # Don't add to results unless we can associate with a file
-                elif "simulating" in line_strip.lower() or "simulation" in line_strip.lower():
-                     tag = "heading"
-                # Fallback for lines not matching specific patterns but maybe useful info
-                else:
-                     tag = "info"
-
-
-                if log_line and output_callback:
+            # Bind module globals used on every line to locals
+            handlers = _LINE_HANDLERS
+            check_interval = _RUNNING_CHECK_INTERVAL
+            lines_since_check = check_interval # Check the flag before the first line
+            for match in _iter_line_matches(stdout_stream):
+                line_strip = match.group().strip()
+                kind = match.lastgroup
+                lines_since_check += 1
+                if kind == 'rule' or lines_since_check > check_interval:
+                    if not is_running_flag_func(): break # Check stop flag
+                    lines_since_check = 1
+
+                tag = handlers[state.state][kind](state, match, line_strip)
+                if tag and output_callback:
                     output_callback(line_strip, tag)
         except TypeError:
             # Handle cases where stdout_stream might not be iterable as expected
@@ -164,4 +312,4 @@ def parse_organize_output(stdout_stream, stderr_stream, is_running_flag_func, ou
     # Final progress update (might be called again by caller, but good fallback)
     if progress_callback: progress_callback(100, "Parsing complete")
 
-    return results
+    return state.results
@@ -6,8 +6,17 @@ for common organization tasks.
 """
 
 import os
+import copy
+import functools
+import hashlib
 import yaml # Added yaml import
 
+try:
+    # The shipped config/organize.yaml, pre-parsed into a Python literal
+    from ._default_config_data import CONFIG as _PREBUILT_DEFAULT_CONFIG, SOURCE_SHA256 as _PREBUILT_DEFAULT_SHA256
+except ImportError:
+    _PREBUILT_DEFAULT_CONFIG = _PREBUILT_DEFAULT_SHA256 = None
+
 # Define possible paths at the module level for broader access (e.g., by tests)
 possible_paths = [
     os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "organize.yaml"), # Project config dir
@@ -16,6 +25,23 @@ possible_paths = [
     os.path.join(os.getenv("APPDATA", ""), "organize-tool", "config.yaml") # Windows config
 ]
 
+def _cached_config(func):
+    """
+    Build a preset once per process and hand out deep copies of it.
+
+    Callers edit the returned dictionary, so the cached original is never exposed.
+    The wrapper keeps lru_cache's cache_clear() for tests and reloads.
+    """
+    cached = functools.lru_cache(maxsize=1)(func)
+
+    @functools.wraps(func)
+    def wrapper():
+        return copy.deepcopy(cached())
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+@_cached_config
 def get_find_duplicates_config():
     """Generate configuration for finding duplicate files."""
     return {
@@ -38,6 +64,7 @@ def get_find_duplicates_config():
         ]
     }
 
+@_cached_config
 def get_rename_photos_config():
     """Generate configuration for renaming photos using EXIF data."""
     return {
@@ -77,6 +104,7 @@ def get_rename_photos_config():
         ]
     }
 
+@_cached_config
 def get_photo_organization_config():
     """Generate configuration for organizing photos by date."""
     return {
@@ -113,6 +141,7 @@ def get_photo_organization_config():
         ]
     }
 
+@_cached_config
 def get_music_organization_config():
     """Generate configuration for organizing music files."""
     # Note: organize-tool doesn't have built-in music tag filters.
@@ -150,6 +179,7 @@ def get_music_organization_config():
         ]
     }
 
+@_cached_config
 def get_document_organization_config():
     """Generate configuration for organizing documents by type."""
     return {
@@ -209,6 +239,7 @@ def get_document_organization_config():
         ]
     }
 
+@_cached_config
 def get_cleanup_rules_config():
     """Generate configuration for cleaning up temporary files and duplicates."""
     return {
@@ -243,11 +274,12 @@ def get_cleanup_rules_config():
         ]
     }
 
-def get_default_organization_config():
-    """
-    Generate a comprehensive default organization configuration.
-    Tries to load from a standard location first.
-    """
+class _DefaultConfigUnavailable(Exception):
+    """Raised when no default config file could be loaded; the failure is not cached."""
+
+@_cached_config
+def _load_default_config():
+    """Load the default config from the first standard location that has one."""
     # Try to find the default configuration file
     default_config_path = None
     # Use the module-level possible_paths list
@@ -256,15 +288,48 @@ def get_default_organization_config():
             default_config_path = path
             break
 
-    if default_config_path:
-        try:
-            with open(default_config_path, 'r') as f:
-                return yaml.safe_load(f)
-        except Exception as e:
-            print(f"Warning: Could not load default config from {default_config_path}: {e}")
-            # Fallback to a generated basic config if loading fails
-            return { 'rules': [] } # Return empty rules if load fails
-    else:
-        # If no default file found, return an empty config
-        print("Warning: Default organize.yaml not found in standard locations.")
+    if not default_config_path:
+        raise _DefaultConfigUnavailable("Default organize.yaml not found in standard locations.")
+
+    try:
+        with open(default_config_path, 'r') as f:
+            text = f.read()
+        # Skip the YAML parser when the file is the one the prebuilt literal was generated from
+        if _PREBUILT_DEFAULT_SHA256 and hashlib.sha256(text.encode('utf-8')).hexdigest() == _PREBUILT_DEFAULT_SHA256:
+            return _PREBUILT_DEFAULT_CONFIG
+        return yaml.safe_load(text)
+    except Exception as e:
+        raise _DefaultConfigUnavailable(f"Could not load default config from {default_config_path}: {e}") from e
+
+def get_default_organization_config():
+    """
+    Generate a comprehensive default organization configuration.
+    Tries to load from a standard location first. A successful load is cached for the
+    process; use get_default_organization_config.cache_clear() to force a reload.
+    Failures are not cached, so a file that appears or is fixed later is picked up.
+    """
+    try:
+        return _load_default_config()
+    except _DefaultConfigUnavailable as e:
+        print(f"Warning: {e}")
+        # Fallback to an empty config if no file could be loaded
         return { 'rules': [] }
+
+get_default_organization_config.cache_clear = _load_default_config.cache_clear
+
+def _write_default_config_data():
+    """Regenerate _default_config_data.py from the shipped config/organize.yaml."""
+    import pprint
+    source_path = possible_paths[0]
+    with open(source_path, 'r') as f:
+        text = f.read()
+    module_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_default_config_data.py")
+    with open(module_path, 'w') as f:
+        f.write('"""\nThe shipped config/organize.yaml as a Python literal, so loading it skips the YAML parser.\n\n'
+                'Generated by `python -m organize_gui.core.preset_manager`; rerun it after editing the YAML file.\n"""\n\n')
+        f.write(f"SOURCE_SHA256 = {hashlib.sha256(text.encode('utf-8')).hexdigest()!r}\n\n")
+        f.write(f"CONFIG = {pprint.pformat(yaml.safe_load(text), sort_dicts=False, width=120)}\n")
+    print(f"Wrote {module_path}")
+
+if __name__ == "__main__":
+    _write_default_config_data()
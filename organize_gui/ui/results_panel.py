@@ -337,7 +337,8 @@ class ResultsPanel(ttk.Frame):
 
     def set_results(self, results_list):
         """Set the results to a new list and update UI."""
-        self.results = results_list if isinstance(results_list, list) else []
+        # Copy into a list, which also builds the row dicts of a parsed result sequence once for filtering
+        self.results = list(results_list) if results_list is not None else []
         self._apply_filters() # Filter and update tree
         self._update_summary()
 
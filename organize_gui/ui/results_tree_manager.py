@@ -8,6 +8,9 @@ import tkinter as tk
 from tkinter import ttk, messagebox, font
 import datetime
 
+# (divisor, unit) for each factor of 1024
+_SIZE_UNITS = tuple((1 << (10 * i), unit) for i, unit in enumerate(('B', 'KB', 'MB', 'GB', 'TB', 'PB')))
+
 class ResultsTreeManager:
     """Manages the results Treeview and related interactions."""
 
@@ -229,8 +232,7 @@ class ResultsTreeManager:
 
     def _format_size(self, size_bytes):
         """Format size in bytes to human-readable string."""
-        if size_bytes == 0: return "0 B"
-        units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-        i = 0
-        while size_bytes >= 1024 and i < len(units) - 1: size_bytes /= 1024; i += 1
-        return f"{size_bytes:.0f} {units[i]}" if i == 0 else f"{size_bytes:.2f} {units[i]}"
+        if size_bytes < 1024: return f"{size_bytes:.0f} B"
+        # Every 10 bits of the size is one factor of 1024, so the bit length picks the unit
+        divisor, unit = _SIZE_UNITS[min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)]
+        return f"{size_bytes / divisor:.2f} {unit}"
@@ -6,6 +6,26 @@ for the RulesPanel.
 import tkinter as tk
 from tkinter import ttk
 
+# (category, path segment, organized/ prefix) checked against move/copy destinations, in order
+_DEST_CATEGORY_MARKERS = tuple(
+    (cat, f'/{cat.lower()}/', f'organized/{cat.lower()}')
+    for cat in ("Documents", "Media", "Development", "Archives", "Applications", "Fonts", "System", "Other")
+)
+# Destination substrings that mark a cleanup rule
+_CLEANUP_MARKERS = ('cleanup/', 'duplicates/')
+
+# Extension -> (priority, category); the lowest priority wins when a filter's extensions span categories
+_EXTENSION_CATEGORIES = {
+    ext: (priority, category)
+    for priority, (category, extensions) in enumerate((
+        ("Documents", ('txt', 'pdf', 'doc', 'docx', 'rtf', 'odt', 'pages', 'key', 'ppt', 'pptx', 'xls', 'xlsx')),
+        ("Media", ('jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'mp3', 'wav', 'aac', 'flac', 'mp4', 'avi', 'mov', 'mkv', 'wmv')),
+        ("Development", ('py', 'js', 'html', 'css', 'java', 'c', 'cpp', 'h', 'hpp', 'cs', 'rb', 'php', 'swift', 'kt', 'go')),
+        ("Archives", ('zip', 'rar', '7z', 'tar', 'gz', 'bz2')),
+    ))
+    for ext in extensions
+}
+
 class RuleListManager:
     """Manages the rule list Treeview and associated controls."""
 
@@ -21,6 +41,7 @@ class RuleListManager:
         self.parent_frame = parent_frame
         self.rules_data_ref = rules_data_ref # Reference to the external rules list
         self._selection_change_callback = None
+        self._category_cache = {} # id(rule) -> (rule, category), valid until the rules change
 
         self._create_widgets()
         self.refresh_list() # Initial population
@@ -101,11 +122,10 @@ class RuleListManager:
                     if isinstance(dest, str):
                         dest_lower = dest.lower()
                         # Simple category matching based on path segments
-                        if any(f'/{cat.lower()}/' in dest_lower or f'organized/{cat.lower()}' in dest_lower for cat in ["Documents", "Media", "Development", "Archives", "Applications", "Fonts", "System", "Other"]):
-                            for cat in ["Documents", "Media", "Development", "Archives", "Applications", "Fonts", "System", "Other"]:
-                                if f'/{cat.lower()}/' in dest_lower or f'organized/{cat.lower()}' in dest_lower:
-                                    return cat
-                        if '/cleanup/' in dest_lower or 'cleanup/' in dest_lower or '/duplicates/' in dest_lower or 'duplicates/' in dest_lower:
+                        for cat, segment, organized in _DEST_CATEGORY_MARKERS:
+                            if segment in dest_lower or organized in dest_lower:
+                                return cat
+                        if any(marker in dest_lower for marker in _CLEANUP_MARKERS):
                             return "Cleanup"
 
         # Check filters for hints (e.g., extension)
@@ -117,25 +137,32 @@ class RuleListManager:
                     extensions = [extensions] # Convert single string to list
 
                 if isinstance(extensions, list):
-                    ext_set = {ext.lower().strip('.') for ext in extensions}
-                    doc_exts = {'txt', 'pdf', 'doc', 'docx', 'rtf', 'odt', 'pages', 'key', 'ppt', 'pptx', 'xls', 'xlsx'}
-                    media_exts = {'jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'mp3', 'wav', 'aac', 'flac', 'mp4', 'avi', 'mov', 'mkv', 'wmv'}
-                    dev_exts = {'py', 'js', 'html', 'css', 'java', 'c', 'cpp', 'h', 'hpp', 'cs', 'rb', 'php', 'swift', 'kt', 'go'}
-                    archive_exts = {'zip', 'rar', '7z', 'tar', 'gz', 'bz2'}
-
-                    if ext_set.intersection(doc_exts): return "Documents"
-                    if ext_set.intersection(media_exts): return "Media"
-                    if ext_set.intersection(dev_exts): return "Development"
-                    if ext_set.intersection(archive_exts): return "Archives"
+                    matches = [_EXTENSION_CATEGORIES[ext] for ext in {ext.lower().strip('.') for ext in extensions} if ext in _EXTENSION_CATEGORIES]
+                    if matches: return min(matches)[1]
 
         return category
 
+    def _cached_rule_category(self, rule):
+        """Return the category of a rule, reusing the one computed since the rules last changed."""
+        entry = self._category_cache.get(id(rule))
+        if entry is None or entry[0] is not rule:
+            entry = self._category_cache[id(rule)] = (rule, self._get_rule_category(rule))
+        return entry[1]
+
     def _filter_rules_ui_event(self, *args):
         """Callback for UI events that trigger filtering."""
-        self.refresh_list()
+        # Only the search text or category filter changed, so cached categories still hold
+        self.refresh_list(rules_changed=False)
 
-    def refresh_list(self):
-        """Clear and re-populate the Treeview based on current filters."""
+    def refresh_list(self, rules_changed=True):
+        """
+        Clear and re-populate the Treeview based on current filters.
+
+        Args:
+            rules_changed (bool): Whether the rules may have been edited since the last refresh.
+                                  Pass False when only the filters changed to reuse cached categories.
+        """
+        if rules_changed: self._category_cache.clear()
         search_text = self.search_var.get().lower()
         category = self.category_var.get()
         
@@ -154,7 +181,7 @@ class RuleListManager:
 
             rule_name = rule.get('name', f'Unnamed Rule {i+1}')
             rule_name_lower = rule_name.lower()
-            rule_category = self._get_rule_category(rule)
+            rule_category = self._cached_rule_category(rule)
             
             print(f"Processing rule {i}: '{rule_name}', enabled: {rule.get('enabled', True)}, category: {rule_category}")
 
@@ -5,21 +5,17 @@ This module provides utility functions for working with file paths
 and directories in a cross-platform way.
 """
 
+import functools
 import os
 import platform
-import subprocess
-import re
+import shutil
+import unicodedata
 
-def expand_path(path):
-    """
-    Expand a path string to an absolute path, handling ~ and environment variables.
-    
-    Args:
-        path (str): Path to expand
-    
-    Returns:
-        str: Expanded absolute path
-    """
+# Size units, one per factor of 1024
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+def _expand(path):
+    """Expand ~ and environment variables in a path and normalize it."""
     # Expand ~ to user home directory
     expanded = os.path.expanduser(path)
     
@@ -27,12 +23,38 @@ def expand_path(path):
     expanded = os.path.expandvars(expanded)
     
     # Normalize path separators
-    expanded = os.path.normpath(expanded)
+    return os.path.normpath(expanded)
+
+@functools.lru_cache(maxsize=1024)
+def _expand_cached(path, home, userprofile):
+    """
+    _expand for paths without environment variables, cached.
+    
+    home and userprofile (the variables expanduser reads) are only part of the
+    cache key, so a changed home directory is not served a stale result.
+    """
+    return _expand(path)
+
+def expand_path(path):
+    """
+    Expand a path string to an absolute path, handling ~ and environment variables.
     
-    # Get absolute path
-    expanded = os.path.abspath(expanded)
+    Args:
+        path (str, bytes or os.PathLike): Path to expand
     
-    return expanded
+    Returns:
+        str: Expanded absolute path (bytes for a bytes path)
+    """
+    path = os.fspath(path)  # Accept path-like objects, as the os.path functions do
+    if not isinstance(path, str) or '$' in path or '%' in path:
+        # expandvars reads the whole environment, which the cache key does not cover;
+        # bytes paths are rare enough to always expand directly
+        expanded = _expand(path)
+    else:
+        expanded = _expand_cached(path, os.environ.get('HOME'), os.environ.get('USERPROFILE'))
+    
+    # abspath depends on the cwd, so it is never cached
+    return os.path.abspath(expanded)
 
 def format_path_for_display(path, max_length=60):
     """
@@ -49,43 +71,11 @@ def format_path_for_display(path, max_length=60):
     if len(path) <= max_length:
         return path
     
-    # Split into parts
-    parts = path.split(os.sep)
-    
-    # If just a filename, truncate the middle
-    if len(parts) <= 2:
-        half = (max_length - 3) // 2
-        return f"{path[:half]}...{path[-half:]}"
-    
-    # Get drive/root
-    drive = parts[0] + os.sep if parts[0].endswith(':') else parts[0]
-    
-    # Get filename
-    filename = parts[-1]
-    
-    # Calculate how many middle paths we can include
-    middle_parts = parts[1:-1]
-    remaining_length = max_length - len(drive) - len(filename) - 5  # 5 for '.../' and '/'
-    
-    if remaining_length <= 0:
-        # Not enough space, just show root and filename
-        return f"{drive}...{os.sep}{filename}"
-    
-    # Try to include some path components from the start and end
-    start_count = min(len(middle_parts), 1)
-    end_count = min(len(middle_parts) - start_count, 1)
-    
-    start_parts = middle_parts[:start_count]
-    end_parts = middle_parts[-end_count:] if end_count > 0 else []
-    
-    formatted = drive + os.sep + os.sep.join(start_parts)
-    if len(middle_parts) > (start_count + end_count):
-        formatted += os.sep + '...'
-    if end_parts:
-        formatted += os.sep + os.sep.join(end_parts)
-    formatted += os.sep + filename
-    
-    return formatted
+    # Keep both ends and replace the middle with a single-character ellipsis,
+    # so the result is exactly max_length characters long
+    head = (max_length - 1) // 2
+    tail = max_length - 1 - head
+    return f"{path[:head]}\u2026{path[len(path) - tail:]}"
 
 def is_path_writable(path):
     """
@@ -97,15 +87,86 @@ def is_path_writable(path):
     Returns:
         bool: True if writable, False otherwise
     """
-    # If path doesn't exist, check if parent directory is writable
-    if not os.path.exists(path):
-        parent = os.path.dirname(path)
-        if not parent:  # Empty string means current directory
-            parent = '.'
-        return os.access(parent, os.W_OK)
+    # Common case: the path exists and is writable, answered by a single access() call
+    if os.access(path, os.W_OK):
+        return True
+    
+    # Path exists but is not writable
+    if os.path.exists(path):
+        return False
+    
+    # Path doesn't exist, check if parent directory is writable
+    parent = os.path.dirname(path)
+    if not parent:  # Empty string means current directory
+        parent = '.'
+    return os.access(parent, os.W_OK)
+
+def _name_key(name):
+    """Comparison key for file names: canonical caseless, so case and Unicode normalization (NFC/NFD) differences match."""
+    return unicodedata.normalize('NFD', unicodedata.normalize('NFD', name).casefold())
+
+def _listed_names(directory):
+    """Name keys of a directory's entries, or None if it cannot be listed."""
+    try:
+        with os.scandir(directory) as entries:
+            return {_name_key(entry.name) for entry in entries}
+    except OSError:
+        return None
+
+def are_paths_writable(paths):
+    """
+    Check whether each of several paths is writable, with the same answers as is_path_writable.
+    
+    Each path costs one access() call, as with is_path_writable. The savings are
+    on paths that fail it: their parent is listed once and the listing is shared
+    by the siblings, so a name missing from it needs no existence check of its
+    own, and each parent's writability is checked at most once.
+    
+    Args:
+        paths (iterable): Paths to check
+    
+    Returns:
+        dict: Path -> True if writable, False otherwise
+    """
+    results = {}
+    listings = {}  # Parent -> name keys of its entries (None if it cannot be listed)
+    writable_parents = {}  # Parent -> os.access result
+    for path in paths:
+        # Common case: the path exists and is writable
+        if os.access(path, os.W_OK):
+            results[path] = True
+            continue
+        
+        parent = os.path.dirname(path) or '.'  # Empty string means current directory
+        if parent not in listings:
+            listings[parent] = _listed_names(parent)
+        listed = listings[parent]
+        
+        name = os.path.basename(path)
+        missing = (listed is not None and name not in ('', os.curdir, os.pardir)
+                   and _name_key(name) not in listed)
+        if not missing and os.path.exists(path):
+            results[path] = False  # Path exists but is not writable
+            continue
+        
+        # Path doesn't exist, check if parent directory is writable
+        if parent not in writable_parents:
+            writable_parents[parent] = os.access(parent, os.W_OK)
+        results[path] = writable_parents[parent]
     
-    # Path exists, check if it's writable
-    return os.access(path, os.W_OK)
+    return results
+
+def _file_sizes(entries, pending):
+    """Yield the sizes of the regular files among scandir entries, queueing subdirectories on pending."""
+    for entry in entries:
+        # Skip symbolic links (to files or directories)
+        if entry.is_symlink():
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            pending.append(entry.path)
+        else:
+            # DirEntry caches the type from the directory listing, so only the size needs a stat
+            yield entry.stat(follow_symlinks=False).st_size
 
 def get_directory_size(path):
     """
@@ -118,12 +179,14 @@ def get_directory_size(path):
         int: Size in bytes
     """
     total_size = 0
-    for dirpath, dirnames, filenames in os.walk(path):
-        for filename in filenames:
-            file_path = os.path.join(dirpath, filename)
-            # Skip symbolic links
-            if not os.path.islink(file_path):
-                total_size += os.path.getsize(file_path)
+    pending = [path]  # Directories still to scan
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue  # Unreadable directories are skipped, as os.walk does
+        with entries:
+            total_size += sum(_file_sizes(entries, pending))
     
     return total_size
 
@@ -137,28 +200,56 @@ def format_size(size_bytes):
     Returns:
         str: Formatted size string
     """
-    # Define units and their thresholds
-    units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
+    # Sizes below 1 KB (including zero) are shown in whole bytes
+    if size_bytes < 1024:
+        return f"{size_bytes:.0f} B"
     
-    # Handle zero size
-    if size_bytes == 0:
-        return "0 B"
-    
-    # Calculate appropriate unit
-    unit_index = min(len(units) - 1, int(len(str(size_bytes)) / 3))
-    unit = units[unit_index]
+    # Every 10 bits of the size is one factor of 1024, so the bit length picks the unit
+    unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    unit = _SIZE_UNITS[unit_index]
     
     # Convert to appropriate unit
-    size_value = size_bytes / (1024 ** unit_index)
+    size_value = size_bytes / (1 << (10 * unit_index))
     
     # Format with appropriate precision
-    if unit_index == 0:  # Bytes
-        return f"{size_value:.0f} {unit}"
-    elif size_value >= 100:  # Large values
+    if size_value >= 100:  # Large values
         return f"{size_value:.1f} {unit}"
     else:  # Small values
         return f"{size_value:.2f} {unit}"
 
+def _open_windows(path):
+    os.startfile(path)
+
+@functools.lru_cache(maxsize=None)
+def _find_executable(name):
+    """Path of an executable on PATH, looked up on first use; a missing one is not cached."""
+    executable = shutil.which(name)
+    if executable is None:
+        raise FileNotFoundError(f"{name} not found on PATH")
+    return executable
+
+def _spawn_and_wait(executable, args):
+    # posix_spawn avoids forking the whole GUI process; the opener exits as soon as it
+    # has handed the path to the file manager, and waiting for it reaps the child
+    pid = os.posix_spawn(executable, args, os.environ)
+    os.waitpid(pid, 0)
+
+def _open_macos(path):
+    _spawn_and_wait(_find_executable('open'), ['open', path])
+
+def _open_linux(path):
+    _spawn_and_wait(_find_executable('xdg-open'), ['xdg-open', path])
+
+# Platform name -> function that opens a directory in the file explorer/finder
+_OPENERS = {
+    "Windows": _open_windows,
+    "Darwin": _open_macos,
+    "Linux": _open_linux,
+}
+
+# The platform cannot change while running, so resolve its opener once (None if unsupported)
+_OPENER = _OPENERS.get(platform.system())
+
 def open_directory(path):
     """
     Open a directory in the system file explorer/finder.
@@ -176,19 +267,11 @@ def open_directory(path):
         if not os.path.exists(path):
             return False
         
-        # Open directory based on platform
-        if platform.system() == "Windows":
-            # Windows
-            os.startfile(path)
-        elif platform.system() == "Darwin":
-            # macOS
-            subprocess.run(['open', path])
-        elif platform.system() == "Linux":
-            # Linux
-            subprocess.run(['xdg-open', path])
-        else:
+        # Open directory with the handler for this platform
+        if _OPENER is None:
             # Unsupported platform for this action
             return False
+        _OPENER(path)
             
         return True # Return True only if an action was attempted
     except Exception:
@@ -205,8 +288,8 @@ def ensure_directory_exists(path):
         bool: True if directory exists or was created, False otherwise
     """
     try:
-        if not os.path.exists(path):
-            os.makedirs(path)
+        # exist_ok avoids a separate existence check (and its race with other creators)
+        os.makedirs(path, exist_ok=True)
         return True
     except Exception:
         return False
@@ -225,18 +308,14 @@ def split_path_at_marker(path, marker):
     # Normalize path
     norm_path = os.path.normpath(path)
     
-    # Regular expression to find the marker
-    pattern = re.compile(f'(.*?{re.escape(os.sep)}{re.escape(marker)})(.*)')
-    match = pattern.match(norm_path)
+    # Split at the first separator+marker occurrence in a single scan
+    head, marker_sep, rel_path = norm_path.partition(os.sep + marker)
     
-    if match:
-        base_path = match.group(1)
-        rel_path = match.group(2)
-        
+    if marker_sep:
         # Remove leading separator from relative path
         if rel_path.startswith(os.sep):
             rel_path = rel_path[len(os.sep):]
         
-        return (base_path, rel_path)
+        return (head + marker_sep, rel_path)
     
     return (path, None)
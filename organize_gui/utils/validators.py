@@ -9,6 +9,22 @@ import os
 import re
 import yaml
 
+# Use libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Characters not allowed in rule names (they cause issues in file names or YAML serialization)
+_INVALID_RULE_NAME_CHARS = re.compile(r'[<>:"|?*\0-\31\\/#]')
+
+# Characters and component names that Windows does not allow in paths
+_WINDOWS_INVALID_PATH_CHARS = re.compile(r'[<>:"|?*\0-\31]')
+_WINDOWS_RESERVED_NAME = re.compile(r'(CON|PRN|AUX|NUL|COM[1-9]|LPT[1-9])(\.|$)', re.IGNORECASE)
+
+# A whole extension: no spaces or special characters, and no leading dot
+_VALID_EXTENSION = re.compile(r'[^<>:"|?*\0-\31\\/#\s.][^<>:"|?*\0-\31\\/#\s]*')
+
 def is_valid_path(path):
     """
     Check if a path is syntactically valid.
@@ -19,29 +35,21 @@ def is_valid_path(path):
     Returns:
         bool: True if valid, False otherwise
     """
-    # Basic checks for invalid characters
-    if not path or path.isspace():
+    # Cheapest rejections first: non-strings, empty and whitespace-only paths
+    if type(path) is not str or not path or path.isspace():
         return False
     
     # Check for invalid characters based on platform
     if os.name == 'nt':  # Windows
         # Check for reserved characters and names
-        invalid_chars = r'[<>:"|?*\0-\31]'
-        reserved_names = r'^(CON|PRN|AUX|NUL|COM[1-9]|LPT[1-9])(\.|$)'
-        
-        if re.search(invalid_chars, path):
+        if _WINDOWS_INVALID_PATH_CHARS.search(path):
             return False
         
         # Check path components for reserved names
-        for part in path.split('\\'):
-            if re.match(reserved_names, part, re.IGNORECASE):
-                return False
-    else:  # Unix/Linux/macOS
-        # Only null byte is invalid
-        if '\0' in path:
-            return False
+        return not any(_WINDOWS_RESERVED_NAME.match(part) for part in path.split('\\'))
     
-    return True
+    # Unix/Linux/macOS: only null byte is invalid
+    return '\0' not in path
 
 def is_valid_yaml(content):
     """
@@ -54,18 +62,18 @@ def is_valid_yaml(content):
         bool: True if valid, False otherwise
     """
     # Ensure input is a string
-    if not isinstance(content, str):
+    if type(content) is not str:
         return False
         
     # Treat empty or whitespace-only strings as potentially valid
     # by yaml.safe_load (parses as None), but maybe semantically invalid
-    # depending on use case. For basic validation, let safe_load decide.
+    # depending on use case. For basic validation, let the safe loader decide.
     # If empty/whitespace should be strictly invalid, add:
     # if not content or content.isspace():
     #     return False
 
     try:
-        yaml.safe_load(content)
+        yaml.load(content, Loader=_SafeLoader)
         return True
     except yaml.YAMLError:
         return False
@@ -80,8 +88,8 @@ def is_valid_rule_name(name):
     Returns:
         bool: True if valid, False otherwise
     """
-    # Rule names should not be empty
-    if not name or name.isspace():
+    # Rule names should be non-empty strings
+    if type(name) is not str or not name or name.isspace():
         return False
     
     # Rule names should not be too long
@@ -90,8 +98,7 @@ def is_valid_rule_name(name):
     
     # Rule names should not contain special characters that might
     # cause issues in file names or yaml serialization
-    invalid_chars = r'[<>:"|?*\0-\31\\/#]'
-    if re.search(invalid_chars, name):
+    if _INVALID_RULE_NAME_CHARS.search(name):
         return False
     
     return True
@@ -106,23 +113,55 @@ def is_valid_extension_list(extensions):
     Returns:
         bool: True if valid, False otherwise
     """
-    if not isinstance(extensions, list):
+    if type(extensions) is not list:
         return False
     
-    # Extensions should be strings
-    for ext in extensions:
-        if not isinstance(ext, str):
-            return False
-        
-        # Extensions should not contain spaces or special characters
-        if not ext or ext.isspace() or re.search(r'[<>:"|?*\0-\31\\/#\s]', ext):
-            return False
-        
-        # Extensions should not start with a dot
-        if ext.startswith('.'):
-            return False
-    
-    return True
+    # Extensions should be non-empty strings without spaces, special characters or a leading dot
+    return all(isinstance(ext, str) and _VALID_EXTENSION.fullmatch(ext) is not None for ext in extensions)
+
+def _is_instance_of(*types):
+    """Build a value check that accepts instances of any of the given types."""
+    return lambda value: isinstance(value, types)
+
+def _is_valid_extension_filter(value):
+    # A single extension string, or a list that must pass the extension list rules
+    if isinstance(value, list):
+        return is_valid_extension_list(value)
+    return isinstance(value, str)
+
+def _is_valid_destination(value):
+    # A destination path, or a dict carrying it under 'dest'
+    if isinstance(value, dict):
+        if 'dest' not in value:
+            return False # Missing 'dest' key
+        value = value['dest']
+    return isinstance(value, str) and is_valid_path(value)
+
+# Known filter types -> check of the filter's value
+_FILTER_VALIDATORS = {
+    'extension': _is_valid_extension_filter,
+    'name': _is_instance_of(str),
+    'regex': _is_instance_of(dict),
+    'size': _is_instance_of(dict),
+    'created': _is_instance_of(str, dict),
+    'lastmodified': _is_instance_of(str, dict),
+    'exif': _is_instance_of(bool),
+    'duplicate': _is_instance_of(dict, bool),
+    'python': _is_instance_of(str),
+}
+
+# Known action types -> check of the action's value
+_ACTION_VALIDATORS = {
+    'move': _is_valid_destination,
+    'copy': _is_valid_destination,
+    'rename': _is_instance_of(str),
+    'delete': _is_instance_of(bool),
+    'trash': _is_instance_of(bool),
+    'echo': _is_instance_of(str),
+    'shell': _is_instance_of(str),
+    'python': _is_instance_of(str),
+    'confirm': _is_instance_of(str),
+}
 
 def is_valid_filter(filter_obj):
     """
@@ -134,39 +173,13 @@ def is_valid_filter(filter_obj):
     Returns:
         bool: True if valid, False otherwise
     """
-    # Basic filter types and their expected value types
-    filter_types = {
-        'extension': (list, str),
-        'name': (str,),
-        'regex': (dict,),
-        'size': (dict,),
-        'created': (str, dict),
-        'lastmodified': (str, dict),
-        'exif': (bool,),
-        'duplicate': (dict, bool),
-        'python': (str,)
-    }
-    
-    if not isinstance(filter_obj, dict) or len(filter_obj) != 1:
-        return False
-    
-    filter_type = list(filter_obj.keys())[0]
-    filter_value = filter_obj[filter_type]
-    
-    # Check if filter type is known
-    if filter_type not in filter_types:
+    if type(filter_obj) is not dict or len(filter_obj) != 1:
         return False
     
-    # Check if filter value has the expected type
-    expected_types = filter_types[filter_type]
-    if not any(isinstance(filter_value, t) for t in expected_types):
-        return False
-    
-    # Specific validation for common filter types
-    if filter_type == 'extension' and isinstance(filter_value, list):
-        return is_valid_extension_list(filter_value)
-    
-    return True
+    # The filter type must be known and its value must pass that type's check
+    filter_type, filter_value = next(iter(filter_obj.items()))
+    validator = _FILTER_VALIDATORS.get(filter_type)
+    return validator is not None and validator(filter_value)
 
 def is_valid_action(action_obj):
     """
@@ -178,46 +191,10 @@ def is_valid_action(action_obj):
     Returns:
         bool: True if valid, False otherwise
     """
-    # Basic action types and their expected value types
-    action_types = {
-        'move': (dict, str),
-        'copy': (dict, str),
-        'rename': (str,),
-        'delete': (bool,),
-        'trash': (bool,),
-        'echo': (str,),
-        'shell': (str,),
-        'python': (str,),
-        'confirm': (str,)
-    }
-    
-    if not isinstance(action_obj, dict) or len(action_obj) != 1:
+    if type(action_obj) is not dict or len(action_obj) != 1:
         return False
     
-    action_type = list(action_obj.keys())[0]
-    action_value = action_obj[action_type]
-    
-    # Check if action type is known
-    if action_type not in action_types:
-        return False
-    
-    # Check if action value has the expected type
-    expected_types = action_types[action_type]
-    if not any(isinstance(action_value, t) for t in expected_types):
-        return False
-
-    # Specific validation for move and copy actions (path validation)
-    if action_type in ('move', 'copy'):
-        dest_path = None
-        if isinstance(action_value, dict):
-            if 'dest' not in action_value:
-                return False # Missing 'dest' key
-            dest_path = action_value['dest']
-        elif isinstance(action_value, str):
-            dest_path = action_value
-
-        # Validate the extracted destination path
-        if not isinstance(dest_path, str) or not is_valid_path(dest_path):
-            return False
-
-    return True
+    # The action type must be known and its value must pass that type's check
+    action_type, action_value = next(iter(action_obj.items()))
+    validator = _ACTION_VALIDATORS.get(action_type)
+    return validator is not None and validator(action_value)
@@ -1,15 +1,26 @@
 import pytest
 import os
 import sys
-import subprocess
-import platform
+from signal import SIGINT
+from subprocess import PIPE, SubprocessError, TimeoutExpired
 import importlib # Needed for module import
 from unittest.mock import patch, MagicMock, ANY
 
 # Assuming OrganizeRunner is in organize_gui.core.organize_runner
-from organize_gui.core.organize_runner import OrganizeRunner
+from organize_gui.core.organize_runner import OrganizeRunner, KILL_WAIT_TIMEOUT
 import organize_gui.core.organize_runner # Import the module itself for patching __file__
 
+# Patch target for existence checks, resolved through the module under test
+RUNNER_EXISTS = 'organize_gui.core.organize_runner.os.path.exists'
+
+def _output_callback(text, tag):
+    """ Signature of the output callbacks OrganizeRunner calls. """
+
+@pytest.fixture
+def callback():
+    """ Fresh output callback mock for every test. """
+    return MagicMock(spec=_output_callback)
+
 # --- Tests for OrganizeRunner ---
 
 @patch.object(OrganizeRunner, '_find_organize_command', return_value='/mock/path/to/organize')
@@ -44,13 +55,10 @@ def test_organize_runner_init(mock_find_script, mock_find_command):
         ("nt", 1, "", "C:\\Py\\python.exe", True, False, False, "Scripts/organize.exe"), # Use forward slash as observed
         # Not found via which/bin, found in /usr/local/bin (Unix)
         ("posix", 1, "", "/usr/py/bin/python", False, False, True, "/usr/local/bin/organize"),
-        # Not found anywhere (Unix) - Fallback
-        ("posix", 1, "", "/usr/py/bin/python", False, False, False, "organize"),
-        # Not found anywhere (Windows) - Fallback
-        ("nt", 1, "", "C:\\Py\\python.exe", False, False, False, "organize"),
         # Subprocess run error - Fallback
         ("posix", -1, "", "/usr/py/bin/python", False, False, False, "organize"), # Simulate subprocess error
-    ]
+    ],
+    ids=["which", "where", "python-bin", "python-scripts", "usr-local-bin", "subprocess-error"]
 )
 @patch.object(OrganizeRunner, '_find_organize_script', return_value='/mock/script') # Mock the other init helper
 def test_find_organize_command(
@@ -69,39 +77,32 @@ def test_find_organize_command(
     # Mock subprocess.run
     mock_subprocess_run = MagicMock() # Create mock instance
     if which_where_rc == -1: # Simulate error
-        mock_subprocess_run.side_effect = subprocess.SubprocessError("Test Error")
+        mock_subprocess_run.side_effect = SubprocessError("Test Error")
     else:
         mock_run_result = MagicMock()
         mock_run_result.returncode = which_where_rc
         mock_run_result.stdout = which_where_output
         mock_subprocess_run.return_value = mock_run_result
-    monkeypatch.setattr(subprocess, 'run', mock_subprocess_run) # Apply mock
+    monkeypatch.setattr('organize_gui.core.organize_runner.subprocess.run', mock_subprocess_run) # Apply mock
 
     # Use real os.path.dirname based on mocked sys.executable
     python_dir = os.path.dirname(sys.executable) # Now sys.executable is mocked
 
-    # Configure os.path.exists mock
-    mock_exists_func = MagicMock() # Create a mock function for side_effect
-    def exists_side_effect(path):
-        # Use the monkeypatched os.name
-        current_os_name = os.name
-        # Use os.path.join consistently for path construction
-        scripts_path = os.path.join(python_dir, 'Scripts', 'organize.exe')
-        bin_path = os.path.join(python_dir, 'organize')
-        usr_local_path = '/usr/local/bin/organize'
-
-        if current_os_name == 'nt' and path == scripts_path:
-            return scripts_exist
-        elif current_os_name == 'posix' and path == bin_path:
-            return bin_exist
-        elif current_os_name == 'posix' and path == usr_local_path:
-            return usr_local_exist
-        # Mock existence for the script path to avoid interference
-        elif path == mock_find_script.return_value:
-             return True # Assume script path exists
-        return False # Default to not existing for other paths
-    mock_exists_func.side_effect = exists_side_effect
-    monkeypatch.setattr(os.path, 'exists', mock_exists_func)
+    # Candidate paths probed by _find_organize_command, joined once per case.
+    # os.path.join is kept here: an empty python_dir must not gain a leading '/'
+    scripts_path = os.path.join(python_dir, 'Scripts', 'organize.exe')
+    bin_path = os.path.join(python_dir, 'organize')
+    usr_local_path = '/usr/local/bin/organize'
+
+    # Configure os.path.exists mock from a lookup table built once per case
+    exists_map = {mock_find_script.return_value: True} # Assume script path exists
+    if os_name_param == 'nt':
+        exists_map[scripts_path] = scripts_exist
+    else: # posix
+        exists_map[bin_path] = bin_exist
+        exists_map[usr_local_path] = usr_local_exist
+    mock_exists_func = MagicMock(side_effect=lambda p: exists_map.get(p, False))
+    monkeypatch.setattr(RUNNER_EXISTS, mock_exists_func)
     # --- End Setup Mocks ---
 
     # Instantiate the runner - this calls _find_organize_command via __init__
@@ -122,15 +123,47 @@ def test_find_organize_command(
     # Check os.path.exists calls using the mock object's assert_any_call
     if which_where_rc != 0 and which_where_rc != -1: # Only check paths if which/where failed
         if current_os_name == 'nt':
-            mock_exists_func.assert_any_call(os.path.join(python_dir, 'Scripts', 'organize.exe'))
+            mock_exists_func.assert_any_call(scripts_path)
         else: # posix
-            mock_exists_func.assert_any_call(os.path.join(python_dir, 'organize'))
+            mock_exists_func.assert_any_call(bin_path)
             if not bin_exist: # Only check /usr/local/bin if not found in python bin
-                 mock_exists_func.assert_any_call('/usr/local/bin/organize')
+                 mock_exists_func.assert_any_call(usr_local_path)
+
+@pytest.mark.parametrize(
+    "os_name, sys_executable_param",
+    [("posix", "/usr/py/bin/python"), ("nt", "C:\\Py\\python.exe")],
+    ids=["posix", "nt"]
+)
+@patch.object(OrganizeRunner, '_find_organize_script', return_value='/mock/script') # Mock the other init helper
+def test_find_organize_command_fallback(mock_find_script, monkeypatch, os_name, sys_executable_param):
+    """ Test _find_organize_command falls back to 'organize' when no candidate exists. """
+    monkeypatch.setattr(os, 'name', os_name)
+    monkeypatch.setattr(sys, 'executable', sys_executable_param)
+    monkeypatch.setattr('organize_gui.core.organize_runner.subprocess.run', MagicMock(return_value=MagicMock(returncode=1, stdout="")))
+    monkeypatch.setattr(RUNNER_EXISTS, lambda p: False)
+
+    assert OrganizeRunner().organize_cmd == "organize"
 
 
 # --- Tests for _find_organize_script ---
 
+# Helper to make organize_runner.py appear to live in /mock/base/organize_gui/core
+def mock_runner_location(monkeypatch):
+    runner_file_path = "/mock/base/organize_gui/core/organize_runner.py"
+    # Use importlib to get the module object for patching __file__
+    runner_module = importlib.import_module('organize_gui.core.organize_runner')
+    monkeypatch.setattr(runner_module, '__file__', runner_file_path, raising=False)
+
+    # Mock os.path.abspath and os.path.dirname
+    monkeypatch.setattr(os.path, 'abspath', lambda p: runner_file_path if p == runner_module.__file__ else p)
+    real_dirname = os.path.dirname
+    def dirname_side_effect(path):
+        if path == runner_file_path: return "/mock/base/organize_gui/core"
+        if path == "/mock/base/organize_gui/core": return "/mock/base/organize_gui"
+        if path == "/mock/base/organize_gui": return "/mock/base"
+        return real_dirname(path) # Fallback
+    monkeypatch.setattr(os.path, 'dirname', dirname_side_effect)
+
 @pytest.mark.parametrize(
     "script_locations_exist, expected_script_path",
     [
@@ -142,15 +175,12 @@ def test_find_organize_command(
         ({"parent_config_sh": True}, "/mock/base/config/organize-files.sh"),
         # Unix: Found in parent/
         ({"parent_sh": True}, "/mock/base/organize-files.sh"),
-        # Unix: Not found (fallback)
-        ({}, "/mock/base/organize_gui/config/organize-files.sh"),
         # Windows: Found in organize_gui/config/
         ({"config_bat": True}, "/mock/base/organize_gui/config/organize-files.bat"),
         # Windows: Found in organize_gui/
         ({"base_bat": True}, "/mock/base/organize_gui/organize-files.bat"),
-        # Windows: Not found (fallback)
-        ({}, "/mock/base/organize_gui/config/organize-files.bat"),
-    ]
+    ],
+    ids=["config-sh", "base-sh", "parent-config-sh", "parent-sh", "config-bat", "base-bat"]
 )
 @patch.object(OrganizeRunner, '_find_organize_command', return_value='mock_cmd') # Mock the other init helper
 def test_find_organize_script(
@@ -164,49 +194,27 @@ def test_find_organize_script(
     os_name_for_test = 'nt' if expected_script_path.endswith('.bat') else 'posix'
     monkeypatch.setattr(os, 'name', os_name_for_test)
 
-    # Mock file structure resolution based on __file__
-    runner_file_path = "/mock/base/organize_gui/core/organize_runner.py"
-    # Use importlib to get the module object for patching __file__
-    runner_module = importlib.import_module('organize_gui.core.organize_runner')
-    monkeypatch.setattr(runner_module, '__file__', runner_file_path, raising=False)
-
-    # Mock os.path.abspath and os.path.dirname
-    monkeypatch.setattr(os.path, 'abspath', lambda p: runner_file_path if p == runner_module.__file__ else p)
+    mock_runner_location(monkeypatch)
     base_dir = "/mock/base/organize_gui"
     parent_dir = "/mock/base"
-    def dirname_side_effect(path):
-        if path == runner_file_path: return "/mock/base/organize_gui/core"
-        if path == "/mock/base/organize_gui/core": return base_dir
-        if path == base_dir: return parent_dir
-        return os.path.dirname(path) # Fallback
-    monkeypatch.setattr(os.path, 'dirname', dirname_side_effect)
 
     # Define potential script paths
-    script_name = "organize-files.bat" if os.name == "nt" else "organize-files.sh" # Use monkeypatched os.name
     paths = {
-        "config_sh": os.path.join(base_dir, "config", "organize-files.sh"),
-        "base_sh": os.path.join(base_dir, "organize-files.sh"),
-        "parent_config_sh": os.path.join(parent_dir, "config", "organize-files.sh"),
-        "parent_sh": os.path.join(parent_dir, "organize-files.sh"),
-        "config_bat": os.path.join(base_dir, "config", "organize-files.bat"),
-        "base_bat": os.path.join(base_dir, "organize-files.bat"),
-        "parent_config_bat": os.path.join(parent_dir, "config", "organize-files.bat"), # Not explicitly checked but good practice
-        "parent_bat": os.path.join(parent_dir, "organize-files.bat"), # Not explicitly checked
+        "config_sh": f"{base_dir}/config/organize-files.sh",
+        "base_sh": f"{base_dir}/organize-files.sh",
+        "parent_config_sh": f"{parent_dir}/config/organize-files.sh",
+        "parent_sh": f"{parent_dir}/organize-files.sh",
+        "config_bat": f"{base_dir}/config/organize-files.bat",
+        "base_bat": f"{base_dir}/organize-files.bat",
+        "parent_config_bat": f"{parent_dir}/config/organize-files.bat", # Not explicitly checked but good practice
+        "parent_bat": f"{parent_dir}/organize-files.bat", # Not explicitly checked
     }
 
-    # Configure os.path.exists mock
-    mock_exists_func = MagicMock() # Create mock function
-    def exists_side_effect(path):
-        # Check against potential script paths based on parametrization
-        for key, loc_path in paths.items():
-            if path == loc_path:
-                return script_locations_exist.get(key, False)
-        # Mock existence for the command path to avoid interference
-        if path == mock_find_cmd.return_value:
-             return True # Assume command path exists
-        return False
-    mock_exists_func.side_effect = exists_side_effect
-    monkeypatch.setattr(os.path, 'exists', mock_exists_func)
+    # Configure os.path.exists mock from a lookup table built once per case
+    exists_map = {paths[key]: exists for key, exists in script_locations_exist.items()}
+    exists_map[mock_find_cmd.return_value] = True # Assume command path exists
+    mock_exists_func = MagicMock(side_effect=lambda p: exists_map.get(p, False))
+    monkeypatch.setattr(RUNNER_EXISTS, mock_exists_func)
     # --- End Setup Mocks ---
 
     # Instantiate the runner - this calls _find_organize_script via __init__
@@ -235,54 +243,45 @@ def test_find_organize_script(
     for p in checked_paths:
         mock_exists_func.assert_any_call(p) # Use the correct mock object
 
+@pytest.mark.parametrize("os_name", ["posix", "nt"])
+@patch.object(OrganizeRunner, '_find_organize_command', return_value='mock_cmd') # Mock the other init helper
+def test_find_organize_script_fallback(mock_find_cmd, monkeypatch, os_name):
+    """ Test _find_organize_script falls back to organize_gui/config/ when no script exists. """
+    monkeypatch.setattr(os, 'name', os_name)
+    mock_runner_location(monkeypatch)
+    monkeypatch.setattr(RUNNER_EXISTS, lambda p: False)
+
+    script_name = "organize-files.bat" if os_name == "nt" else "organize-files.sh"
+    assert OrganizeRunner().script_path == f"/mock/base/organize_gui/config/{script_name}"
+
 
 # --- Tests for run method ---
 
 # Helper to create a mock runner instance with specific init values
-def create_runner(monkeypatch, cmd='organize_cmd', script='/path/script.sh', script_exists=True):
+# Paths other than the script are looked up in exists_map, which callers may seed or mutate
+def create_runner(monkeypatch, cmd='organize_cmd', script='/path/script.sh', script_exists=True, exists_map=None):
     monkeypatch.setattr(OrganizeRunner, '_find_organize_command', lambda self: cmd)
     monkeypatch.setattr(OrganizeRunner, '_find_organize_script', lambda self: script)
-    # Mock os.path.exists specifically for the script path check within run()
-    original_exists = os.path.exists
-    # We need to handle the case where os.path itself might be mocked by the test calling create_runner
-    def exists_for_script(p):
-        if p == script:
-            return script_exists
-        # If os.path.exists was mocked, call that mock, otherwise call original
-        if isinstance(original_exists, MagicMock):
-            return original_exists(p)
-        elif callable(original_exists):
-             try:
-                 # Check if it's a monkeypatched function
-                 if hasattr(original_exists, '__wrapped__'):
-                      # This might indicate a deeper mock, try calling it
-                      return original_exists(p)
-                 else: # Assume it's the real function or a simple lambda
-                      return original_exists(p)
-             except Exception: # Fallback if calling fails unexpectedly
-                  return False
-        return False # Default fallback
-
-    monkeypatch.setattr(os.path, 'exists', exists_for_script)
+    if exists_map is None:
+        exists_map = {}
+    monkeypatch.setattr(RUNNER_EXISTS, lambda p: exists_map.get(p, p == script and script_exists))
     return OrganizeRunner()
 
-def test_run_already_running(monkeypatch):
+def test_run_already_running(monkeypatch, callback):
     """ Test calling run when is_running is True. """
     runner = create_runner(monkeypatch)
     runner.is_running = True
-    mock_output_callback = MagicMock()
-    result = runner.run(output_callback=mock_output_callback)
+    result = runner.run(output_callback=callback)
     assert result == {'success': False, 'message': "Process already running."}
-    mock_output_callback.assert_called_once_with("Process already running.", "error")
+    callback.assert_called_once_with("Process already running.", "error")
 
 @patch.object(OrganizeRunner, '_run_with_script')
 @patch.object(OrganizeRunner, '_run_with_command')
 def test_run_uses_script_when_exists(mock_run_cmd, mock_run_script, monkeypatch):
     """ Test that run calls _run_with_script if script exists. """
     script_path = '/path/exists/script.sh'
-    # Ensure os.path.exists returns True only for the script path during run's check
-    monkeypatch.setattr(os.path, 'exists', lambda p: p == script_path)
-    runner = create_runner(monkeypatch, script=script_path, script_exists=True) # create_runner uses the monkeypatched exists
+    # os.path.exists returns True only for the script path during run's check
+    runner = create_runner(monkeypatch, script=script_path, script_exists=True)
 
     runner.run(config_path='/config.yaml', simulation=True, verbose=True)
     mock_run_script.assert_called_once_with(simulation=True, output_stream=ANY, output_callback=ANY, config_path='/config.yaml', verbose=True)
@@ -293,9 +292,8 @@ def test_run_uses_script_when_exists(mock_run_cmd, mock_run_script, monkeypatch)
 def test_run_uses_command_when_script_missing(mock_run_cmd, mock_run_script, monkeypatch):
     """ Test that run calls _run_with_command if script does not exist. """
     script_path = '/path/missing/script.sh'
-     # Ensure os.path.exists returns False for the script path during run's check
-    monkeypatch.setattr(os.path, 'exists', lambda p: False)
-    runner = create_runner(monkeypatch, script=script_path, script_exists=False) # create_runner uses the monkeypatched exists
+    # os.path.exists returns False for the script path during run's check
+    runner = create_runner(monkeypatch, script=script_path, script_exists=False)
 
     runner.run(config_path='/config.yaml', simulation=False, verbose=False)
     mock_run_cmd.assert_called_once_with(simulation=False, output_stream=ANY, output_callback=ANY, config_path='/config.yaml', verbose=False)
@@ -305,11 +303,11 @@ def test_run_uses_command_when_script_missing(mock_run_cmd, mock_run_script, mon
 @patch('organize_gui.core.organize_runner.yaml.dump')
 @patch('organize_gui.core.organize_runner.os.unlink')
 @patch.object(OrganizeRunner, '_run_with_command') # Assume command runner used for temp file
-def test_run_with_config_data(mock_run_cmd, mock_unlink, mock_yaml_dump, mock_tempfile, monkeypatch):
+def test_run_with_config_data(mock_run_cmd, mock_unlink, mock_yaml_dump, mock_tempfile, monkeypatch, callback):
     """ Test run creates, uses, and deletes a temp file for config_data. """
-    # Ensure script doesn't exist to force command runner
-    monkeypatch.setattr(os.path, 'exists', lambda p: False)
-    runner = create_runner(monkeypatch, script_exists=False)
+    # Single existence table; the script is missing to force the command runner
+    exists_map = {}
+    runner = create_runner(monkeypatch, script_exists=False, exists_map=exists_map)
 
     # Setup mock for NamedTemporaryFile
     mock_temp_file_obj = MagicMock()
@@ -321,240 +319,158 @@ def test_run_with_config_data(mock_run_cmd, mock_unlink, mock_yaml_dump, mock_te
     mock_tempfile.return_value = mock_temp_file_context
 
     config_data = {'rules': [{'name': 'Temp Rule'}]}
-    mock_output_callback = MagicMock()
-
-    # Mock os.path.exists again for the unlink check at the end
-    # It needs to return True for the temp file path
-    original_exists = os.path.exists
-    def final_exists_check(p):
-        if p == "/tmp/fake_config.yaml":
-            return True
-        return original_exists(p) # Or just False if no other checks needed
-    monkeypatch.setattr(os.path, 'exists', final_exists_check)
 
+    # The temp file must exist for the unlink check at the end
+    exists_map["/tmp/fake_config.yaml"] = True
 
-    runner.run(config_data=config_data, simulation=True, output_callback=mock_output_callback)
+    runner.run(config_data=config_data, simulation=True, output_callback=callback)
 
     # Check temp file creation and usage
     mock_tempfile.assert_called_once_with(mode='w', suffix='.yaml', delete=False, encoding='utf-8')
     mock_yaml_dump.assert_called_once_with(config_data, mock_temp_file_obj, default_flow_style=False, sort_keys=False, indent=2)
-    mock_run_cmd.assert_called_once_with(simulation=True, output_stream=ANY, output_callback=mock_output_callback, config_path="/tmp/fake_config.yaml", verbose=False) # verbose=False default
+    mock_run_cmd.assert_called_once_with(simulation=True, output_stream=ANY, output_callback=callback, config_path="/tmp/fake_config.yaml", verbose=False) # verbose=False default
 
     # Check temp file deletion
     mock_unlink.assert_called_once_with("/tmp/fake_config.yaml")
     # Check debug message for deletion
-    mock_output_callback.assert_any_call("Deleted temporary config file: /tmp/fake_config.yaml", "debug")
+    callback.assert_any_call("Deleted temporary config file: /tmp/fake_config.yaml", "debug")
 
 @patch('organize_gui.core.organize_runner.tempfile.NamedTemporaryFile', side_effect=IOError("Cannot create temp file"))
-def test_run_with_config_data_tempfile_error(mock_tempfile, monkeypatch):
+def test_run_with_config_data_tempfile_error(mock_tempfile, monkeypatch, callback):
     """ Test run handles errors during temporary file creation. """
     runner = create_runner(monkeypatch)
     config_data = {'rules': [{'name': 'Temp Rule'}]}
-    mock_output_callback = MagicMock()
 
-    result = runner.run(config_data=config_data, output_callback=mock_output_callback)
+    result = runner.run(config_data=config_data, output_callback=callback)
 
     assert result['success'] is False
     # Check specific error message if possible, otherwise general check
     assert "Failed to write temporary config file" in result['message'] or "Cannot create temp file" in result['message']
     # Check that the error message *as formatted by the exception handler* was passed to the callback
-    mock_output_callback.assert_any_call(f"Error running process: {result['message'].split(': ', 1)[1]}", "error")
+    callback.assert_any_call(f"Error running process: {result['message'].split(': ', 1)[1]}", "error")
 
 
-def test_run_with_invalid_config_data(monkeypatch):
+def test_run_with_invalid_config_data(monkeypatch, callback):
     """ Test run handles invalid config_data structure. """
     runner = create_runner(monkeypatch)
-    mock_output_callback = MagicMock()
 
-    result = runner.run(config_data="not a dict", output_callback=mock_output_callback)
+    result = runner.run(config_data="not a dict", output_callback=callback)
     assert result['success'] is False
     assert "Invalid config_data provided" in result['message']
     # Check that the error message *as formatted by the exception handler* was passed to the callback
-    mock_output_callback.assert_any_call(f"Error running process: {result['message'].split(': ', 1)[1]}", "error")
+    callback.assert_any_call(f"Error running process: {result['message'].split(': ', 1)[1]}", "error")
 
     # Reset mock for second call
-    mock_output_callback.reset_mock()
-    result = runner.run(config_data={"no_rules": True}, output_callback=mock_output_callback)
+    callback.reset_mock()
+    result = runner.run(config_data={"no_rules": True}, output_callback=callback)
     assert result['success'] is False
     assert "Invalid config_data provided" in result['message']
     # Check the call for the second invalid case
-    mock_output_callback.assert_called_once_with(f"Error running process: {result['message'].split(': ', 1)[1]}", "error")
+    callback.assert_called_once_with(f"Error running process: {result['message'].split(': ', 1)[1]}", "error")
 
 
-# Add tests for other methods below
-@patch('organize_gui.core.organize_runner.parse_organize_output') # Mock the parser
-@patch('subprocess.Popen')
-def test_run_with_command_successful(mock_popen, mock_parse_output, monkeypatch): # Add mock_parse_output
-    """Test successful execution of _run_with_command method."""
-    runner = create_runner(monkeypatch)
-    mock_process = MagicMock()
-    mock_process.stdout = MagicMock() # Still need stdout object for Popen args
-
-    mock_process.returncode = 0 # Set return code for completion check
-    mock_popen.return_value = mock_process
-    mock_parse_output.return_value = [{'status': 'parsed'}] # Mock parser return
-
-    callback = MagicMock()
-    result = runner._run_with_command(simulation=True, 
-                                     output_callback=callback, 
-                                     config_path="/test/config.yaml",
-                                     verbose=True)
-    # --- Assertions ---
-    expected_cmd = [runner.organize_cmd, '--config-file', '/test/config.yaml', '--simulate', '--verbose']
-    # Check Popen call arguments (stderr=subprocess.STDOUT is key here)
-    mock_popen.assert_called_once_with(expected_cmd, stdout=sys.stdout, stderr=subprocess.STDOUT, text=True)
-
-    # Check that parse_organize_output was called correctly
-    mock_parse_output.assert_called_once_with(
-        stdout_stream=mock_process.stdout,
-        stderr_stream=None, # Because stderr=subprocess.STDOUT
-        is_running_flag_func=ANY, # Check that a callable was passed
-        output_callback=callback,
-        progress_callback=None,
-        simulation=True
-    )
-    mock_process.wait.assert_called_once() # Check process wait was called
-
-    # Check final result and state
-    assert result["success"] is True
-    assert "completed" in result["message"].lower() # Check for completion message
-    assert result["results"] == [{'status': 'parsed'}] # Check parser results are passed through
-    assert runner.is_running is False
-
-    # Check only essential callbacks
-    callback.assert_any_call("Running command: organize_cmd --config-file /test/config.yaml --simulate --verbose", "info") # Initial call
-    callback.assert_any_call(result["message"], "success") # Final status message callback
+# Helper to check several positional callback calls with a single scan of call_args_list
+def assert_callback_has(cb, *expected):
+    actual = {c.args for c in cb.call_args_list}
+    missing = [e for e in expected if e not in actual]
+    assert not missing, f"Callback calls not found: {missing}"
 
-@patch('organize_gui.core.organize_runner.parse_organize_output') # Mock the parser
-@patch('subprocess.Popen')
-def test_run_with_script_successful(mock_popen, mock_parse_output, monkeypatch): # Add mock_parse_output
-    """Test successful execution of _run_with_script method."""
-    runner = create_runner(monkeypatch)
+# Helper to drive a Popen-backed runner method and check the shared flow
+def _assert_popen_flow(runner, method, *, returncode, expected_success, parse_result,
+                       popen_mock, parse_mock, callback, expected_cmd, expected_start_message, **kwargs):
     mock_process = MagicMock()
-    mock_process.stdout = MagicMock()
-    mock_process.stderr = MagicMock()
-    mock_process.returncode = 0
-    mock_popen.return_value = mock_process
-    mock_parse_output.return_value = [{'status': 'parsed_script'}] # Mock parser return
+    mock_process.returncode = returncode
+    popen_mock.return_value = mock_process
+    parse_mock.return_value = parse_result
 
-    callback = MagicMock()
-    result = runner._run_with_script(simulation=False,
-                                    output_callback=callback, 
-                                    config_path="/test/config.yaml",
-                                    verbose=False)
+    result = method(output_callback=callback, **kwargs)
 
-    # --- Assertions ---
-    assert result["success"] is True
-    assert "completed" in result["message"].lower()
-    mock_popen.assert_called_once() # Basic check, could be more specific about args
-    # Check that parse_organize_output was called correctly
-    mock_parse_output.assert_called_once_with(
+    # Both stdout and stderr are piped so the parser can consume them separately
+    popen_mock.assert_called_once_with(expected_cmd, stdout=PIPE, stderr=PIPE, text=True)
+    parse_mock.assert_called_once_with(
         stdout_stream=mock_process.stdout,
         stderr_stream=mock_process.stderr,
         is_running_flag_func=ANY, # Check that a callable was passed
         output_callback=callback,
         progress_callback=None,
-        simulation=False
+        simulation=kwargs['simulation']
     )
     mock_process.wait.assert_called_once() # Check process wait was called
 
     # Check final result and state
-    assert result["success"] is True
-    assert "completed" in result["message"].lower()
-    assert result["results"] == [{'status': 'parsed_script'}]
+    assert result["success"] is expected_success
+    assert ("completed" if expected_success else "failed") in result["message"].lower()
+    assert result["results"] == parse_result # Check parser results are passed through
     assert runner.is_running is False
 
-    # Check only essential callbacks
-    callback.assert_any_call("Running script: /path/script.sh --run --config /test/config.yaml", "info") # Initial call
-    callback.assert_any_call(result["message"], "success") # Final status
+    # Check only essential callbacks: initial call and final status
+    assert_callback_has(
+        callback,
+        (expected_start_message, "info"),
+        (result["message"], "success" if expected_success else "error")
+    )
+    return result
 
 @patch('organize_gui.core.organize_runner.parse_organize_output') # Mock the parser
-@patch('subprocess.Popen')
-def test_run_with_command_error(mock_popen, mock_parse_output, monkeypatch): # Add mock_parse_output
-    """Test error handling in _run_with_command."""
+@patch('organize_gui.core.organize_runner.subprocess.Popen')
+def test_run_with_command_successful(mock_popen, mock_parse_output, monkeypatch, callback):
+    """Test successful execution of _run_with_command method."""
     runner = create_runner(monkeypatch)
-    mock_process = MagicMock()
-    mock_process.stdout = MagicMock()
-    mock_process.returncode = 1 # Indicate failure
-    mock_popen.return_value = mock_process
-    mock_parse_output.return_value = [{'status': 'parsed_error'}] # Mock parser return
-
-    callback = MagicMock()
-    result = runner._run_with_command(simulation=True, 
-                                    output_callback=callback,
-                                    config_path="/test/config.yaml")
-
-    # --- Assertions ---
-    assert result["success"] is False
-    assert "failed" in result["message"].lower()
-    # Check that parse_organize_output was called correctly
-    mock_parse_output.assert_called_once_with(
-        stdout_stream=mock_process.stdout,
-        stderr_stream=None, # Because stderr=subprocess.STDOUT
-        is_running_flag_func=ANY, # Check that a callable was passed
-        output_callback=callback,
-        progress_callback=None,
-        simulation=True
+    _assert_popen_flow(
+        runner, runner._run_with_command,
+        returncode=0, expected_success=True, parse_result=[{'status': 'parsed'}],
+        popen_mock=mock_popen, parse_mock=mock_parse_output, callback=callback,
+        expected_cmd=['organize_cmd', 'sim', '/test/config.yaml'],
+        expected_start_message="Running command: organize_cmd sim /test/config.yaml",
+        simulation=True, config_path="/test/config.yaml", verbose=True
     )
-    mock_process.wait.assert_called_once() # Check process wait was called
 
-    # Check final result and state
-    assert result["success"] is False
-    assert "failed" in result["message"].lower()
-    assert result["results"] == [{'status': 'parsed_error'}]
-    assert runner.is_running is False
+@patch('organize_gui.core.organize_runner.parse_organize_output') # Mock the parser
+@patch('organize_gui.core.organize_runner.subprocess.Popen')
+def test_run_with_script_successful(mock_popen, mock_parse_output, monkeypatch, callback):
+    """Test successful execution of _run_with_script method."""
+    runner = create_runner(monkeypatch)
+    _assert_popen_flow(
+        runner, runner._run_with_script,
+        returncode=0, expected_success=True, parse_result=[{'status': 'parsed_script'}],
+        popen_mock=mock_popen, parse_mock=mock_parse_output, callback=callback,
+        expected_cmd=['/path/script.sh', '--run', '--config-file', '/test/config.yaml'],
+        expected_start_message="Running script: /path/script.sh --run --config-file /test/config.yaml",
+        simulation=False, config_path="/test/config.yaml", verbose=False
+    )
 
-    # Check only essential callbacks
-    callback.assert_any_call("Running command: organize_cmd --config-file /test/config.yaml --simulate", "info") # Initial call
-    callback.assert_any_call(result["message"], "error") # Final status message callback
+@patch('organize_gui.core.organize_runner.parse_organize_output') # Mock the parser
+@patch('organize_gui.core.organize_runner.subprocess.Popen')
+def test_run_with_command_error(mock_popen, mock_parse_output, monkeypatch, callback):
+    """Test error handling in _run_with_command."""
+    runner = create_runner(monkeypatch)
+    _assert_popen_flow(
+        runner, runner._run_with_command,
+        returncode=1, expected_success=False, parse_result=[{'status': 'parsed_error'}],
+        popen_mock=mock_popen, parse_mock=mock_parse_output, callback=callback,
+        expected_cmd=['organize_cmd', 'sim', '/test/config.yaml'],
+        expected_start_message="Running command: organize_cmd sim /test/config.yaml",
+        simulation=True, config_path="/test/config.yaml"
+    )
 
 @patch('organize_gui.core.organize_runner.parse_organize_output') # Mock the parser
-@patch('subprocess.Popen')
-def test_run_with_script_error(mock_popen, mock_parse_output, monkeypatch):
+@patch('organize_gui.core.organize_runner.subprocess.Popen')
+def test_run_with_script_error(mock_popen, mock_parse_output, monkeypatch, callback):
     """Test error handling in _run_with_script."""
     runner = create_runner(monkeypatch)
-    mock_process = MagicMock()
-    mock_process.stdout = MagicMock()
-    mock_process.stderr = MagicMock()
-    mock_process.returncode = 1 # Indicate failure
-    mock_popen.return_value = mock_process
-    mock_parse_output.return_value = [{'status': 'parsed_script_error'}] # Mock parser return
-
-    callback = MagicMock()
-    result = runner._run_with_script(simulation=False,
-                                    output_callback=callback,
-                                    config_path="/test/config.yaml")
-
-    # --- Assertions ---
-    assert result["success"] is False
-    assert "failed" in result["message"].lower()
-    mock_popen.assert_called_once()
-    # Check that parse_organize_output was called correctly
-    mock_parse_output.assert_called_once_with(
-        stdout_stream=mock_process.stdout,
-        stderr_stream=mock_process.stderr,
-        is_running_flag_func=ANY,
-        output_callback=callback,
-        progress_callback=None,
-        simulation=False
+    _assert_popen_flow(
+        runner, runner._run_with_script,
+        returncode=1, expected_success=False, parse_result=[{'status': 'parsed_script_error'}],
+        popen_mock=mock_popen, parse_mock=mock_parse_output, callback=callback,
+        expected_cmd=['/path/script.sh', '--run', '--config-file', '/test/config.yaml'],
+        expected_start_message="Running script: /path/script.sh --run --config-file /test/config.yaml",
+        simulation=False, config_path="/test/config.yaml"
     )
-    mock_process.wait.assert_called_once()
-
-    # Check final result and state
-    assert result["success"] is False
-    assert "failed" in result["message"].lower()
-    assert result["results"] == [{'status': 'parsed_script_error'}]
-    assert runner.is_running is False
-
-    # Check only essential callbacks
-    callback.assert_any_call("Running script: /path/script.sh --run --config /test/config.yaml", "info") # Initial call
-    callback.assert_any_call(result["message"], "error") # Final status
 
-@patch('subprocess.Popen', side_effect=FileNotFoundError("Command not found"))
-def test_run_with_command_popen_exception(mock_popen, monkeypatch):
+@patch('organize_gui.core.organize_runner.subprocess.Popen', side_effect=FileNotFoundError("Command not found"))
+def test_run_with_command_popen_exception(mock_popen, monkeypatch, callback):
     """Test Popen exception handling in _run_with_command."""
     runner = create_runner(monkeypatch)
-    callback = MagicMock()
     result = runner._run_with_command(simulation=True,
                                     output_callback=callback,
                                     config_path="/test/config.yaml")
@@ -562,17 +478,15 @@ def test_run_with_command_popen_exception(mock_popen, monkeypatch):
     assert result["success"] is False
     # Check for the actual error message format
     assert "Command error: Command not found" in result["message"]
-    assert "Command not found" in result["message"] # Include original error
     assert runner.is_running is False
     assert runner.current_process is None
     # Check the message actually sent to the callback
     callback.assert_any_call(f"Error with command: {FileNotFoundError('Command not found')}", "error")
 
-@patch('subprocess.Popen', side_effect=PermissionError("Permission denied"))
-def test_run_with_script_popen_exception(mock_popen, monkeypatch):
+@patch('organize_gui.core.organize_runner.subprocess.Popen', side_effect=PermissionError("Permission denied"))
+def test_run_with_script_popen_exception(mock_popen, monkeypatch, callback):
     """Test Popen exception handling in _run_with_script."""
     runner = create_runner(monkeypatch)
-    callback = MagicMock()
     result = runner._run_with_script(simulation=False,
                                     output_callback=callback,
                                     config_path="/test/config.yaml")
@@ -580,15 +494,20 @@ def test_run_with_script_popen_exception(mock_popen, monkeypatch):
     assert result["success"] is False
     # Check for the actual error message format
     assert "Script error: Permission denied" in result["message"]
-    assert "Permission denied" in result["message"] # Include original error
     assert runner.is_running is False
     assert runner.current_process is None
     # Check the message actually sent to the callback
     callback.assert_any_call(f"Error with script: {PermissionError('Permission denied')}", "error")
 
 
-def test_kill_running_process(monkeypatch):
-    """Test killing a running process."""
+@pytest.mark.parametrize(
+    "system, expected_call, expected_args",
+    [("Linux", "send_signal", (SIGINT,)), ("Windows", "terminate", ())],
+    ids=["posix", "windows"]
+)
+def test_kill_running_process(monkeypatch, system, expected_call, expected_args):
+    """Test killing a running process that ignores the graceful stop request."""
+    monkeypatch.setattr('organize_gui.core.organize_runner.platform.system', lambda: system)
     runner = create_runner(monkeypatch)
 
     # Setup mock process
@@ -596,32 +515,22 @@ def test_kill_running_process(monkeypatch):
     # Ensure poll() returns None initially to indicate running
     mock_process.poll.return_value = None
 
-    # Make wait raise TimeoutExpired only when called with timeout, otherwise return None (simulate success)
-    def wait_side_effect(*args, **kwargs):
-        if 'timeout' in kwargs:
-            raise subprocess.TimeoutExpired(cmd="mock_cmd", timeout=kwargs['timeout'])
-        return None # Simulate successful wait when no timeout is given (after kill)
-    mock_process.wait.side_effect = wait_side_effect
+    # First wait (with timeout) times out, second wait (after kill) succeeds
+    mock_process.wait.side_effect = [TimeoutExpired(cmd="mock_cmd", timeout=KILL_WAIT_TIMEOUT), None]
 
     runner.current_process = mock_process
     runner.is_running = True
 
-    # Mock platform.system() if needed, assuming posix for SIGINT check
-    monkeypatch.setattr(platform, 'system', lambda: 'posix') # Or 'Windows'
-
     result = runner.kill()
 
     assert result["success"] is True
     assert "killed forcefully" in result["message"] # Check for the specific message
-    # Check signal/terminate based on mocked platform
-    if platform.system() == 'Windows':
-         mock_process.terminate.assert_called_once() # Check terminate was called on Windows
-    else:
-         mock_process.send_signal.assert_called_once_with(subprocess.signal.SIGINT) # Check SIGINT was sent (on Unix)
+    # SIGINT on Unix-like systems, terminate() on Windows
+    getattr(mock_process, expected_call).assert_called_once_with(*expected_args)
 
     # Check that wait was called twice: once with timeout, once without
     assert mock_process.wait.call_count == 2
-    mock_process.wait.assert_any_call(timeout=1.0) # Check the call with timeout
+    mock_process.wait.assert_any_call(timeout=KILL_WAIT_TIMEOUT) # Check the call with timeout
     mock_process.wait.assert_any_call()          # Check the call without timeout (after kill)
 
     mock_process.kill.assert_called_once() # Crucially, check kill was called after timeout
@@ -1,11 +1,21 @@
+import io
 import pytest
-from unittest.mock import Mock, call
+from unittest.mock import Mock
 
 # Assuming the function is in organize_gui.core.output_parser
-from organize_gui.core.output_parser import parse_organize_output
+from organize_gui.core.output_parser import parse_organize_output, ParsedResults
+from organize_gui.core import output_parser
 
 # --- Tests for parse_organize_output ---
 
+def record_output():
+    """ Return an output callback and the list of (text, tag) pairs it records, minus the parser's "Processing:" lines. """
+    output_calls = []
+    def output_callback(text, tag):
+        if not text.startswith("Processing:"):
+            output_calls.append((text, tag))
+    return output_callback, output_calls
+
 def test_parse_simulation_output_basic():
     """ Test parsing a simple simulation output. """
     stdout_lines = [
@@ -19,7 +29,7 @@ def test_parse_simulation_output_basic():
         "Simulation finished.",
     ]
     stderr_lines = []
-    mock_output_callback = Mock()
+    output_callback, output_calls = record_output()
     mock_progress_callback = Mock()
     is_running_flag_func = lambda: True # Always true for this test
 
@@ -27,7 +37,7 @@ def test_parse_simulation_output_basic():
         iter(stdout_lines),
         iter(stderr_lines),
         is_running_flag_func,
-        mock_output_callback,
+        output_callback,
         mock_progress_callback,
         simulation=True
     )
@@ -41,18 +51,16 @@ def test_parse_simulation_output_basic():
 
     # Check calls to output_callback (excluding file processing lines)
     expected_output_calls = [
-        call("Simulating...", "heading"),
-        call("Rule \"Move Docs\"", "heading"),
+        ("Simulating...", "heading"),
+        ("Rule \"Move Docs\"", "heading"),
         # ✓ /path/to/doc1.txt -> triggers internal callback, not this one directly
-        call("Would move \"/path/to/doc1.txt\" to \"/dest/Docs/doc1.txt\"", "move"),
+        ("Would move \"/path/to/doc1.txt\" to \"/dest/Docs/doc1.txt\"", "move"),
         # ✓ /path/to/image.jpg -> triggers internal callback, not this one directly
-        call("Rule \"Move Images\"", "heading"),
-        call("Would move \"/path/to/image.jpg\" to \"/dest/Images/image.jpg\"", "move"),
-        call("Simulation finished.", "heading"), # Contains "simulation" -> heading tag
+        ("Rule \"Move Images\"", "heading"),
+        ("Would move \"/path/to/image.jpg\" to \"/dest/Images/image.jpg\"", "move"),
+        ("Simulation finished.", "heading"), # Contains "simulation" -> heading tag
     ]
-    # Filter out the internal "Processing:" calls made by the parser itself
-    actual_output_calls = [c for c in mock_output_callback.call_args_list if not c.args[0].startswith("Processing:")]
-    assert actual_output_calls == expected_output_calls
+    assert output_calls == expected_output_calls
 
     # Check calls to progress_callback (approximate check)
     assert mock_progress_callback.call_count >= 2 # Should be called for each file + final
@@ -70,13 +78,13 @@ def test_parse_real_run_output():
         "  Moving \"/path/to/vid2.mkv\" to \"/dest/Videos/vid2.mkv\"",
     ]
     stderr_lines = []
-    mock_output_callback = Mock()
+    output_callback, output_calls = record_output()
     mock_progress_callback = Mock()
     is_running_flag_func = lambda: True
 
     results = parse_organize_output(
         iter(stdout_lines), iter(stderr_lines), is_running_flag_func,
-        mock_output_callback, mock_progress_callback, simulation=False
+        output_callback, mock_progress_callback, simulation=False
     )
 
     expected_results = [
@@ -86,12 +94,11 @@ def test_parse_real_run_output():
     assert results == expected_results
 
     expected_output_calls = [
-        call("Rule \"Move Videos\"", "heading"),
-        call("Moving \"/path/to/vid1.mp4\" to \"/dest/Videos/vid1.mp4\"", "move"),
-        call("Moving \"/path/to/vid2.mkv\" to \"/dest/Videos/vid2.mkv\"", "move"),
+        ("Rule \"Move Videos\"", "heading"),
+        ("Moving \"/path/to/vid1.mp4\" to \"/dest/Videos/vid1.mp4\"", "move"),
+        ("Moving \"/path/to/vid2.mkv\" to \"/dest/Videos/vid2.mkv\"", "move"),
     ]
-    actual_output_calls = [c for c in mock_output_callback.call_args_list if not c.args[0].startswith("Processing:")]
-    assert actual_output_calls == expected_output_calls
+    assert output_calls == expected_output_calls
     mock_progress_callback.assert_called_with(100, "Parsing complete")
 
 
@@ -104,13 +111,13 @@ def test_parse_output_with_errors():
         "✗ /path/to/other.tmp", # File pattern with error marker
     ]
     stderr_lines = ["Some error occurred on stderr"]
-    mock_output_callback = Mock()
+    output_callback, output_calls = record_output()
     mock_progress_callback = Mock()
     is_running_flag_func = lambda: True
 
     results = parse_organize_output(
         iter(stdout_lines), iter(stderr_lines), is_running_flag_func,
-        mock_output_callback, mock_progress_callback, simulation=False
+        output_callback, mock_progress_callback, simulation=False
     )
 
     # Check results list includes the error
@@ -121,15 +128,13 @@ def test_parse_output_with_errors():
 
     # Check output callback includes error lines and stderr
     expected_output_calls = [
-        call("Rule \"Cleanup\"", "heading"),
-        call("Error: Could not delete file \"/path/to/file.tmp\" - Permission denied", "error"),
-        call("STDERR:\nSome error occurred on stderr", "error"),
+        ("Rule \"Cleanup\"", "heading"),
+        ("Error: Could not delete file \"/path/to/file.tmp\" - Permission denied", "error"),
+        ("STDERR:\nSome error occurred on stderr", "error"),
     ]
-    # Filter out "Processing:" calls
-    actual_output_calls = [c for c in mock_output_callback.call_args_list if not c.args[0].startswith("Processing:")]
     # Check if expected calls are a subset of actual calls (order might vary slightly with stderr)
     for expected_call in expected_output_calls:
-         assert expected_call in actual_output_calls, f"Expected call not found: {expected_call}"
+         assert expected_call in output_calls, f"Expected call not found: {expected_call}"
 
     mock_progress_callback.assert_called_with(100, "Parsing complete")
 
@@ -142,23 +147,22 @@ def test_parse_output_with_echo():
         "  echo: Processed report.pdf",
     ]
     stderr_lines = []
-    mock_output_callback = Mock()
+    output_callback, output_calls = record_output()
     mock_progress_callback = Mock()
     is_running_flag_func = lambda: True
 
     results = parse_organize_output(
         iter(stdout_lines), iter(stderr_lines), is_running_flag_func,
-        mock_output_callback, mock_progress_callback, simulation=False
+        output_callback, mock_progress_callback, simulation=False
     )
 
     assert results == [] # Echo doesn't add to results list
 
     expected_output_calls = [
-        call("Rule \"Notify\"", "heading"),
-        call("echo: Processed report.pdf", "echo"),
+        ("Rule \"Notify\"", "heading"),
+        ("echo: Processed report.pdf", "echo"),
     ]
-    actual_output_calls = [c for c in mock_output_callback.call_args_list if not c.args[0].startswith("Processing:")]
-    assert actual_output_calls == expected_output_calls
+    assert output_calls == expected_output_calls
     mock_progress_callback.assert_called_with(100, "Parsing complete")
 
 
@@ -173,19 +177,20 @@ def test_parse_output_stops_when_flag_is_false():
         "  Moving \"file2.txt\" to \"dest/file2.txt\"",
     ]
     stderr_lines = []
-    mock_output_callback = Mock()
+    output_callback, output_calls = record_output()
     mock_progress_callback = Mock()
 
-    # Flag function that returns False after the first rule is processed
+    # The flag is checked before the first line and at each Rule header,
+    # so returning False on the second check stops at "Rule 2"
     call_count = 0
     def is_running_flag_func():
         nonlocal call_count
         call_count += 1
-        return call_count <= 3 # Allow Simulating, Rule, ✓, Moving lines
+        return call_count <= 1
 
     results = parse_organize_output(
         iter(stdout_lines), iter(stderr_lines), is_running_flag_func,
-        mock_output_callback, mock_progress_callback, simulation=False
+        output_callback, mock_progress_callback, simulation=False
     )
 
     # Only the first move should be in results
@@ -196,74 +201,136 @@ def test_parse_output_stops_when_flag_is_false():
 
     # Check that output callback only received calls for the first part
     expected_output_calls = [
-        call("Rule \"Rule 1\"", "heading"),
-        call("Moving \"file1.txt\" to \"dest/file1.txt\"", "move"),
+        ("Rule \"Rule 1\"", "heading"),
+        ("Moving \"file1.txt\" to \"dest/file1.txt\"", "move"),
     ]
-    actual_output_calls = [c for c in mock_output_callback.call_args_list if not c.args[0].startswith("Processing:")]
-    assert actual_output_calls == expected_output_calls
+    assert output_calls == expected_output_calls
 
     # Progress might not reach 100 if stopped early
     assert mock_progress_callback.called
 
-def test_parse_copy_action():
-    """ Test parsing output for copy actions. """
+@pytest.mark.parametrize("rule_name, source, action_line, destination, status, tag", [
+    ("Copy Reports", "/path/to/report_v1.pdf", "Copying \"/path/to/report_v1.pdf\" to \"/dest/Reports/report_v1.pdf\"", "/dest/Reports/report_v1.pdf", "Copied", "copy"),
+    ("Rename Images", "/path/to/IMG_001.jpg", "Renaming \"/path/to/IMG_001.jpg\" to \"/path/to/Vacation_001.jpg\"", "/path/to/Vacation_001.jpg", "Renamed", "rename"),
+    ("Delete Temp Files", "/path/to/old.tmp", "Deleting \"/path/to/old.tmp\"", None, "Deleted", "delete"),
+    ("Move Important", "/path/to/file.txt", "Skipped (conflict)", None, "Skipped", "skipped"), # Example skipped message
+], ids=["copy", "rename", "delete", "skipped"])
+def test_parse_single_action(rule_name, source, action_line, destination, status, tag):
+    """ Test parsing output for copy, rename, delete and skipped actions. """
     stdout_lines = [
-        "Rule \"Copy Reports\"",
-        "✓ /path/to/report_v1.pdf",
-        "  Copying \"/path/to/report_v1.pdf\" to \"/dest/Reports/report_v1.pdf\"",
+        f"Rule \"{rule_name}\"",
+        f"✓ {source}",
+        f"  {action_line}",
     ]
-    mock_output_callback = Mock()
-    results = parse_organize_output(iter(stdout_lines), iter([]), lambda: True, mock_output_callback, None, simulation=False)
-    expected_results = [{'source': '/path/to/report_v1.pdf', 'destination': '/dest/Reports/report_v1.pdf', 'status': 'Copied', 'rule': 'Copy Reports'}]
+    output_callback, output_calls = record_output()
+    results = parse_organize_output(iter(stdout_lines), iter([]), lambda: True, output_callback, None, simulation=False)
+    expected_results = [{'source': source, 'destination': destination, 'status': status, 'rule': rule_name}]
     assert results == expected_results
-    # Check callback tag (assuming 'copy' tag will be added)
-    actual_output_calls = [c for c in mock_output_callback.call_args_list if not c.args[0].startswith("Processing:")]
-    assert call("Copying \"/path/to/report_v1.pdf\" to \"/dest/Reports/report_v1.pdf\"", "copy") in actual_output_calls
+    # Check callback tag
+    assert (action_line, tag) in output_calls
+
+def test_parse_text_pipe_read_in_blocks(monkeypatch):
+    """ Test a pipe-like text stream is read in blocks, including lines and characters split across blocks. """
+    # A tiny block size forces lines and the multi-byte ✓ to straddle block boundaries
+    monkeypatch.setattr(output_parser, '_READ_CHUNK_SIZE', 7)
+    data = (
+        "Rule \"Move Videos\"\r\n"
+        "✓ /path/to/vid1.mp4\n"
+        "  Moving \"/path/to/vid1.mp4\" to \"/dest/Videos/vid1.mp4\"\n"
+        "\n"
+        "✓ /path/to/vid2.mkv\n"
+        "  Moving \"/path/to/vid2.mkv\" to \"/dest/Videos/vid2.mkv\"" # No trailing newline
+    )
+    stdout_stream = io.TextIOWrapper(io.BytesIO(data.encode('utf-8')), encoding='utf-8')
+    output_callback, output_calls = record_output()
+
+    results = parse_organize_output(stdout_stream, None, lambda: True, output_callback, None, simulation=False)
+
+    assert results == [
+        {'source': '/path/to/vid1.mp4', 'destination': '/dest/Videos/vid1.mp4', 'status': 'Moved', 'rule': 'Move Videos'},
+        {'source': '/path/to/vid2.mkv', 'destination': '/dest/Videos/vid2.mkv', 'status': 'Moved', 'rule': 'Move Videos'}
+    ]
+    assert ("Rule \"Move Videos\"", "heading") in output_calls
 
-def test_parse_rename_action():
-    """ Test parsing output for rename actions. """
+def test_parse_text_pipe_matches_line_by_line():
+    """ Test block scanning of a text pipe gives the same results and output as matching line by line. """
     stdout_lines = [
-        "Rule \"Rename Images\"",
-        "✓ /path/to/IMG_001.jpg",
-        "  Renaming \"/path/to/IMG_001.jpg\" to \"/path/to/Vacation_001.jpg\"",
+        "Simulating...",
+        "Rule \"Move Docs\"",
+        "✓ /path/to/doc1.txt",
+        "  some unrecognised detail", # Logged as info, keeps the file context
+        "  Would move \"/path/to/doc1.txt\" to \"/dest/Docs/doc1.txt\"",
+        "   ",
+        "✓ /path/to/doc2.txt",
+        "  Error: Permission denied",
+        "error: global failure",
+        "Simulation finished.",
     ]
-    mock_output_callback = Mock()
-    results = parse_organize_output(iter(stdout_lines), iter([]), lambda: True, mock_output_callback, None, simulation=False)
-    expected_results = [{'source': '/path/to/IMG_001.jpg', 'destination': '/path/to/Vacation_001.jpg', 'status': 'Renamed', 'rule': 'Rename Images'}]
-    assert results == expected_results
-    # Check callback tag (assuming 'rename' tag will be added)
-    actual_output_calls = [c for c in mock_output_callback.call_args_list if not c.args[0].startswith("Processing:")]
-    assert call("Renaming \"/path/to/IMG_001.jpg\" to \"/path/to/Vacation_001.jpg\"", "rename") in actual_output_calls
 
-def test_parse_delete_action():
-    """ Test parsing output for delete actions. """
+    def run(stdout_stream):
+        output_callback, output_calls = record_output()
+        results = parse_organize_output(stdout_stream, None, lambda: True, output_callback, None, simulation=True)
+        return list(results), output_calls
+
+    pipe = io.TextIOWrapper(io.BytesIO("\r\n".join(stdout_lines).encode('utf-8')), encoding='utf-8')
+    assert run(pipe) == run(iter(stdout_lines))
+
+def test_parse_results_columns():
+    """ Test the results expose their columns and build row dicts on demand. """
     stdout_lines = [
-        "Rule \"Delete Temp Files\"",
-        "✓ /path/to/old.tmp",
-        "  Deleting \"/path/to/old.tmp\"",
+        "Rule \"Cleanup\"",
+        "✓ /path/to/old.log",
+        "  Deleting \"/path/to/old.log\"",
+        "✓ /path/to/file.tmp",
+        "  Error: Permission denied",
     ]
-    mock_output_callback = Mock()
-    results = parse_organize_output(iter(stdout_lines), iter([]), lambda: True, mock_output_callback, None, simulation=False)
-    expected_results = [{'source': '/path/to/old.tmp', 'destination': None, 'status': 'Deleted', 'rule': 'Delete Temp Files'}]
-    assert results == expected_results
-     # Check callback tag (assuming 'delete' tag will be added)
-    actual_output_calls = [c for c in mock_output_callback.call_args_list if not c.args[0].startswith("Processing:")]
-    assert call("Deleting \"/path/to/old.tmp\"", "delete") in actual_output_calls
 
-def test_parse_skipped_status():
-    """ Test parsing output for skipped files. """
+    results = parse_organize_output(iter(stdout_lines), None, lambda: True, None, None, simulation=False)
+
+    assert isinstance(results, ParsedResults)
+    assert results.sources == ['/path/to/old.log', '/path/to/file.tmp']
+    assert results.statuses == ['Deleted', 'Error']
+    assert results.rules == ['Cleanup', 'Cleanup']
+    assert len(results) == 2
+    assert results[0] == {'source': '/path/to/old.log', 'destination': None, 'status': 'Deleted', 'rule': 'Cleanup'}
+    assert results[-1] == {'source': '/path/to/file.tmp', 'status': 'Error', 'rule': 'Cleanup'} # No destination key for errors
+    assert results[1:] == [results[1]]
+    with pytest.raises(IndexError):
+        results[2]
+
+def test_parse_rule_names_shared():
+    """ Test rows of the same rule share one rule name string, even across repeated headers. """
     stdout_lines = [
-        "Rule \"Move Important\"",
-        "✓ /path/to/file.txt",
-        "  Skipped (conflict)", # Example skipped message
+        "Rule \"Move Docs\"",
+        "✓ /a/doc1.txt",
+        "  Moving \"/a/doc1.txt\" to \"/dest/doc1.txt\"",
+        "Rule \"Move Docs\"",
+        "✓ /b/doc2.txt",
+        "  Moving \"/b/doc2.txt\" to \"/dest/doc2.txt\"",
     ]
-    mock_output_callback = Mock()
-    results = parse_organize_output(iter(stdout_lines), iter([]), lambda: True, mock_output_callback, None, simulation=False)
-    expected_results = [{'source': '/path/to/file.txt', 'destination': None, 'status': 'Skipped', 'rule': 'Move Important'}]
-    assert results == expected_results
-    # Check callback tag (assuming 'skipped' tag will be added)
-    actual_output_calls = [c for c in mock_output_callback.call_args_list if not c.args[0].startswith("Processing:")]
-    assert call("Skipped (conflict)", "skipped") in actual_output_calls
+
+    results = parse_organize_output(iter(stdout_lines), None, lambda: True, None, None, simulation=False)
+
+    assert results.rules == ['Move Docs', 'Move Docs']
+    assert results.rules[0] is results.rules[1]
+    assert results.statuses[0] is results.statuses[1]
+
+def test_parse_output_checks_flag_periodically(monkeypatch):
+    """ Test the stop flag is checked every _RUNNING_CHECK_INTERVAL lines within a rule, not on every line. """
+    monkeypatch.setattr(output_parser, '_RUNNING_CHECK_INTERVAL', 4)
+    stdout_lines = ["Rule \"Move All\""]
+    for i in range(10):
+        stdout_lines += [f"✓ file{i}.txt", "", f"  Moving \"file{i}.txt\" to \"dest/file{i}.txt\""]
+    flag_checks = []
+    def is_running_flag_func():
+        flag_checks.append(True)
+        return len(flag_checks) < 3 # Stop at the third check
+
+    results = parse_organize_output(iter(stdout_lines), None, is_running_flag_func, None, None, simulation=False)
+
+    # Checks happen at the Rule header and every 4th non-blank line after it; the third falls on file3.txt's move line
+    assert len(flag_checks) == 3
+    assert results.sources == ['file0.txt', 'file1.txt', 'file2.txt']
 
 
 # Finished testing output_parser.py
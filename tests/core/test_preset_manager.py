@@ -2,125 +2,171 @@
 Unit tests for organize_gui.core.preset_manager
 """
 
-import unittest
-import os
-from unittest.mock import patch, mock_open, MagicMock
-import yaml # Need to import yaml for the default config test
+import io
+import pytest
+import yaml
 
 # Adjust import path as necessary
 from organize_gui.core import preset_manager
 
-class TestPresetManager(unittest.TestCase):
-    """Test suite for preset manager functions."""
-
-    def assertIsPresetConfig(self, config, expected_rule_count=None):
-        """Helper assertion to check basic preset config structure."""
-        self.assertIsInstance(config, dict)
-        self.assertIn('rules', config)
-        self.assertIsInstance(config['rules'], list)
-        if expected_rule_count is not None:
-            self.assertEqual(len(config['rules']), expected_rule_count)
-        for rule in config['rules']:
-            self.assertIsInstance(rule, dict)
-            self.assertIn('name', rule)
-            self.assertIn('enabled', rule)
-            self.assertIn('filters', rule)
-            self.assertIn('actions', rule)
-
-    def test_get_find_duplicates_config(self):
-        """Test the find duplicates preset."""
-        config = preset_manager.get_find_duplicates_config()
-        self.assertIsPresetConfig(config, expected_rule_count=1)
-        # Check a specific detail
-        self.assertEqual(config['rules'][0]['name'], "Find Duplicate Files")
-
-    def test_get_rename_photos_config(self):
-        """Test the rename photos preset."""
-        config = preset_manager.get_rename_photos_config()
-        self.assertIsPresetConfig(config, expected_rule_count=2)
-        self.assertEqual(config['rules'][0]['name'], "Rename Photos with EXIF Data")
-        self.assertEqual(config['rules'][1]['name'], "Rename Photos without EXIF Data (using creation date)")
-
-    def test_get_photo_organization_config(self):
-        """Test the photo organization preset."""
-        config = preset_manager.get_photo_organization_config()
-        self.assertIsPresetConfig(config, expected_rule_count=2)
-        self.assertEqual(config['rules'][0]['name'], "Organize Photos by Date (EXIF)")
-        self.assertEqual(config['rules'][1]['name'], "Organize Photos by Date (Created)")
-
-    def test_get_music_organization_config(self):
-        """Test the music organization preset."""
-        config = preset_manager.get_music_organization_config()
-        self.assertIsPresetConfig(config, expected_rule_count=2)
-        self.assertEqual(config['rules'][0]['name'], "Organize Music Files by Extension")
-        self.assertEqual(config['rules'][1]['name'], "Find Music Duplicates")
-
-    def test_get_document_organization_config(self):
-        """Test the document organization preset."""
-        config = preset_manager.get_document_organization_config()
-        self.assertIsPresetConfig(config, expected_rule_count=4)
-        self.assertEqual(config['rules'][0]['name'], "Organize Text Documents")
-        self.assertEqual(config['rules'][1]['name'], "Organize Office Documents")
-        self.assertEqual(config['rules'][2]['name'], "Organize PDF Documents")
-        self.assertEqual(config['rules'][3]['name'], "Organize Archive Files")
-
-    def test_get_cleanup_rules_config(self):
-        """Test the cleanup rules preset."""
-        config = preset_manager.get_cleanup_rules_config()
-        self.assertIsPresetConfig(config, expected_rule_count=2)
-        self.assertEqual(config['rules'][0]['name'], "Clean Temporary Files")
-        self.assertEqual(config['rules'][1]['name'], "Find Duplicates in Downloads")
-
-    # --- Tests for get_default_organization_config ---
-
-    @patch('organize_gui.core.preset_manager.os.path.exists')
-    @patch('organize_gui.core.preset_manager.open', new_callable=mock_open, read_data="rules:\n  - name: Loaded Rule")
-    @patch('organize_gui.core.preset_manager.yaml.safe_load')
-    def test_get_default_config_found_and_loaded(self, mock_safe_load, mock_open_func, mock_exists):
-        """Test loading default config when file exists and loads correctly."""
-        # Simulate finding the file at the first possible path
-        mock_exists.side_effect = lambda p: p == preset_manager.possible_paths[0]
-        mock_loaded_data = {'rules': [{'name': 'Loaded Rule'}]}
-        mock_safe_load.return_value = mock_loaded_data
-
-        config = preset_manager.get_default_organization_config()
-
-        mock_exists.assert_called_with(preset_manager.possible_paths[0])
-        mock_open_func.assert_called_once_with(preset_manager.possible_paths[0], 'r')
-        mock_safe_load.assert_called_once()
-        self.assertEqual(config, mock_loaded_data)
-
-    @patch('organize_gui.core.preset_manager.os.path.exists')
-    @patch('organize_gui.core.preset_manager.open', new_callable=mock_open, read_data="invalid yaml:")
-    @patch('organize_gui.core.preset_manager.yaml.safe_load', side_effect=yaml.YAMLError("Load failed"))
-    def test_get_default_config_found_but_load_fails(self, mock_safe_load, mock_open_func, mock_exists):
-        """Test fallback when default config exists but fails to load."""
-        mock_exists.side_effect = lambda p: p == preset_manager.possible_paths[1] # Simulate finding it at second path
-
-        config = preset_manager.get_default_organization_config()
-
-        mock_exists.assert_any_call(preset_manager.possible_paths[0])
-        mock_exists.assert_any_call(preset_manager.possible_paths[1])
-        mock_open_func.assert_called_once_with(preset_manager.possible_paths[1], 'r')
-        mock_safe_load.assert_called_once()
-        self.assertEqual(config, {'rules': []}) # Should return fallback
-
-    @patch('organize_gui.core.preset_manager.os.path.exists', return_value=False)
-    @patch('organize_gui.core.preset_manager.open', new_callable=mock_open)
-    @patch('organize_gui.core.preset_manager.yaml.safe_load')
-    def test_get_default_config_not_found(self, mock_safe_load, mock_open_func, mock_exists):
-        """Test fallback when no default config file is found."""
-        config = preset_manager.get_default_organization_config()
-
-        # Check that all possible paths were checked
-        self.assertEqual(mock_exists.call_count, len(preset_manager.possible_paths))
-        for path in preset_manager.possible_paths:
-            mock_exists.assert_any_call(path)
-
-        mock_open_func.assert_not_called()
-        mock_safe_load.assert_not_called()
-        self.assertEqual(config, {'rules': []}) # Should return fallback
-
-
-if __name__ == '__main__':
-    unittest.main()
+class _FakeFS:
+    """In-memory stand-in for the default config files: maps path -> file contents and records lookups."""
+
+    def __init__(self, contents):
+        self.contents = contents
+        self.checked = [] # Paths passed to exists(), in order
+        self.opened = [] # (path, mode) pairs passed to open()
+
+    def exists(self, path):
+        self.checked.append(path)
+        return path in self.contents
+
+    def open(self, path, mode='r'):
+        self.opened.append((path, mode))
+        return io.StringIO(self.contents[path])
+
+@pytest.fixture(autouse=True)
+def clear_default_config_cache():
+    """Start each test with an empty default-config cache and clear it afterwards."""
+    preset_manager.get_default_organization_config.cache_clear()
+    yield
+    preset_manager.get_default_organization_config.cache_clear()
+
+@pytest.fixture
+def use_fake_fs(monkeypatch):
+    """Return a function that routes the preset manager's file lookups to a _FakeFS holding the given contents."""
+    def install(contents):
+        fs = _FakeFS(contents)
+        monkeypatch.setattr(preset_manager.os.path, 'exists', fs.exists)
+        monkeypatch.setattr(preset_manager, 'open', fs.open, raising=False)
+        return fs
+    return install
+
+def _check_preset_config(config, expected_rule_count=None):
+    """Helper to check basic preset config structure."""
+    assert isinstance(config, dict)
+    assert 'rules' in config
+    assert isinstance(config['rules'], list)
+    if expected_rule_count is not None:
+        assert len(config['rules']) == expected_rule_count
+    for rule in config['rules']:
+        assert isinstance(rule, dict)
+        assert 'name' in rule
+        assert 'enabled' in rule
+        assert 'filters' in rule
+        assert 'actions' in rule
+
+def test_get_find_duplicates_config():
+    """Test the find duplicates preset."""
+    config = preset_manager.get_find_duplicates_config()
+    _check_preset_config(config, expected_rule_count=1)
+    # Check a specific detail
+    assert config['rules'][0]['name'] == "Find Duplicate Files"
+
+def test_get_rename_photos_config():
+    """Test the rename photos preset."""
+    config = preset_manager.get_rename_photos_config()
+    _check_preset_config(config, expected_rule_count=2)
+    assert config['rules'][0]['name'] == "Rename Photos with EXIF Data"
+    assert config['rules'][1]['name'] == "Rename Photos without EXIF Data (using creation date)"
+
+def test_get_photo_organization_config():
+    """Test the photo organization preset."""
+    config = preset_manager.get_photo_organization_config()
+    _check_preset_config(config, expected_rule_count=2)
+    assert config['rules'][0]['name'] == "Organize Photos by Date (EXIF)"
+    assert config['rules'][1]['name'] == "Organize Photos by Date (Created)"
+
+def test_get_music_organization_config():
+    """Test the music organization preset."""
+    config = preset_manager.get_music_organization_config()
+    _check_preset_config(config, expected_rule_count=2)
+    assert config['rules'][0]['name'] == "Organize Music Files by Extension"
+    assert config['rules'][1]['name'] == "Find Music Duplicates"
+
+def test_get_document_organization_config():
+    """Test the document organization preset."""
+    config = preset_manager.get_document_organization_config()
+    _check_preset_config(config, expected_rule_count=4)
+    assert config['rules'][0]['name'] == "Organize Text Documents"
+    assert config['rules'][1]['name'] == "Organize Office Documents"
+    assert config['rules'][2]['name'] == "Organize PDF Documents"
+    assert config['rules'][3]['name'] == "Organize Archive Files"
+
+def test_get_cleanup_rules_config():
+    """Test the cleanup rules preset."""
+    config = preset_manager.get_cleanup_rules_config()
+    _check_preset_config(config, expected_rule_count=2)
+    assert config['rules'][0]['name'] == "Clean Temporary Files"
+    assert config['rules'][1]['name'] == "Find Duplicates in Downloads"
+
+# --- Tests for get_default_organization_config ---
+
+def test_get_default_config_cached(use_fake_fs):
+    """Test the default config lookup runs once and callers get independent copies."""
+    fs = use_fake_fs({preset_manager.possible_paths[0]: "rules:\n  - name: Loaded Rule"})
+
+    first = preset_manager.get_default_organization_config()
+    first['rules'].append({'name': 'Edited'})
+    second = preset_manager.get_default_organization_config()
+
+    assert fs.checked == preset_manager.possible_paths[:1]
+    assert fs.opened == [(preset_manager.possible_paths[0], 'r')]
+    assert second == {'rules': [{'name': 'Loaded Rule'}]}
+
+def test_get_default_config_failure_not_cached(use_fake_fs):
+    """Test a missing or broken default config is looked up again on the next call."""
+    fs = use_fake_fs({})
+    assert preset_manager.get_default_organization_config() == {'rules': []}
+
+    # The file appears, broken at first, then fixed
+    fs.contents[preset_manager.possible_paths[0]] = "rules: [unclosed"
+    assert preset_manager.get_default_organization_config() == {'rules': []}
+    fs.contents[preset_manager.possible_paths[0]] = "rules:\n  - name: Loaded Rule"
+    assert preset_manager.get_default_organization_config() == {'rules': [{'name': 'Loaded Rule'}]}
+
+def test_get_default_config_found_and_loaded(use_fake_fs):
+    """Test loading default config when file exists and loads correctly."""
+    # The file exists at the first possible path
+    fs = use_fake_fs({preset_manager.possible_paths[0]: "rules:\n  - name: Loaded Rule"})
+
+    config = preset_manager.get_default_organization_config()
+
+    assert fs.checked == preset_manager.possible_paths[:1]
+    assert fs.opened == [(preset_manager.possible_paths[0], 'r')]
+    assert config == {'rules': [{'name': 'Loaded Rule'}]}
+
+def test_get_default_config_found_but_load_fails(use_fake_fs):
+    """Test fallback when default config exists but fails to load."""
+    # The file exists at the second path but is not valid YAML
+    fs = use_fake_fs({preset_manager.possible_paths[1]: "rules: [unclosed"})
+
+    config = preset_manager.get_default_organization_config()
+
+    assert fs.checked == preset_manager.possible_paths[:2]
+    assert fs.opened == [(preset_manager.possible_paths[1], 'r')]
+    assert config == {'rules': []} # Should return fallback
+
+def test_get_default_config_not_found(use_fake_fs):
+    """Test fallback when no default config file is found."""
+    fs = use_fake_fs({})
+
+    config = preset_manager.get_default_organization_config()
+
+    # Check that all possible paths were checked
+    assert fs.checked == preset_manager.possible_paths
+    assert fs.opened == []
+    assert config == {'rules': []} # Should return fallback
+
+def test_get_default_config_prebuilt(use_fake_fs, monkeypatch):
+    """Test the shipped organize.yaml is served from the prebuilt literal without running the YAML parser."""
+    with open(preset_manager.possible_paths[0], 'r') as f:
+        shipped_text = f.read()
+    expected = yaml.safe_load(shipped_text)
+    fs = use_fake_fs({preset_manager.possible_paths[0]: shipped_text})
+    monkeypatch.setattr(preset_manager.yaml, 'safe_load', lambda stream: pytest.fail("YAML parser should be skipped"))
+
+    config = preset_manager.get_default_organization_config()
+
+    assert fs.opened == [(preset_manager.possible_paths[0], 'r')]
+    assert config == expected
@@ -87,6 +87,20 @@ class TestRuleListManagerCategoryLogic(unittest.TestCase):
         rule = {'filters': [{'extension': None}]} # Malformed filter
         self.assertEqual(self.manager._get_rule_category(rule), "Other")
 
+    def test_cached_category_reused_until_cleared(self):
+        """Test categories are computed once per rule until the cache is cleared."""
+        rule = {'actions': [{'move': '~/Organized/Media/'}]}
+        self.manager._category_cache.clear()
+        self.manager._get_rule_category = MagicMock(return_value="Media")
+
+        self.assertEqual(self.manager._cached_rule_category(rule), "Media")
+        self.assertEqual(self.manager._cached_rule_category(rule), "Media")
+        self.manager._get_rule_category.assert_called_once_with(rule)
+
+        self.manager._category_cache.clear() # What refresh_list does when the rules changed
+        self.manager._cached_rule_category(rule)
+        self.assertEqual(self.manager._get_rule_category.call_count, 2)
+
 
 # Note: Testing refresh_list, selection methods, etc., is generally not practical
 # with standard unit tests due to the heavy reliance on Tkinter widgets.
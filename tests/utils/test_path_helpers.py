@@ -1,35 +1,32 @@
 import pytest
 import os
-import platform
+from pathlib import Path
 from unittest.mock import patch
 
-# Assuming functions are in organize_gui.utils.path_helpers
-from organize_gui.utils.path_helpers import expand_path
+from organize_gui.utils import path_helpers
+from organize_gui.utils.path_helpers import (
+    expand_path,
+    _expand_cached,
+    format_path_for_display,
+    is_path_writable,
+    are_paths_writable,
+    get_directory_size,
+    format_size,
+    open_directory,
+    ensure_directory_exists,
+    split_path_at_marker,
+)
 
 # --- Tests for expand_path ---
 
-@pytest.mark.parametrize("input_path, mock_user, mock_vars, expected_norm, expected_abs", [
-    # Basic case
-    ("/some/path", "/home/user", {}, "/some/path", "/abs/some/path"),
-    # Tilde expansion
-    ("~/Documents", "/home/user", {}, "/home/user/Documents", "/abs/home/user/Documents"),
-    # Env var expansion (Unix-style)
-    ("$HOME/data", "/home/user", {"HOME": "/users/test"}, "/users/test/data", "/abs/users/test/data"),
-    # Env var expansion (Windows-style - though expandvars handles both)
-    ("%USERPROFILE%/files", "/home/user", {"USERPROFILE": "C:\\Users\\Test"}, "C:\\Users\\Test\\files", "C:\\abs\\Users\\Test\\files"),
-    # Combined tilde and env var
-    ("~/project/$PROJECT_NAME", "/home/user", {"PROJECT_NAME": "my_proj"}, "/home/user/project/my_proj", "/abs/home/user/project/my_proj"),
-    # Path needing normalization
-    ("/dir/./subdir/../other", "/home/user", {}, "/dir/other", "/abs/dir/other"),
-    # Empty path
-    ("", "/home/user", {}, ".", "/abs/current/dir"), # abspath('.') behavior
-    # None path (should likely raise error or be handled) - Let's assume it raises TypeError implicitly
-    # (None, "/home/user", {}, None, None), # Test case for None if handled explicitly
-])
-def test_expand_path(input_path, mock_user, mock_vars, expected_norm, expected_abs, monkeypatch):
-    """
-    Tests the expand_path function with mocking for os functions.
-    """
+@pytest.fixture
+def expand_path_case(request, monkeypatch):
+    """ Install the os mocks described by one expand_path table row; returns (input_path, expected_abs). """
+    input_path, mock_user, mock_vars, expected_norm, expected_abs = request.param
+
+    # Expansions are cached; start clean so this row's mocks are used
+    _expand_cached.cache_clear()
+
     # Mock os.path.expanduser
     monkeypatch.setattr(os.path, 'expanduser', lambda p: p.replace('~', mock_user) if p and p.startswith('~') else p)
 
@@ -52,6 +49,34 @@ def test_expand_path(input_path, mock_user, mock_vars, expected_norm, expected_a
     if not input_path:
          monkeypatch.setattr(os, 'getcwd', lambda: "/abs/current/dir") # Provide a mock CWD
 
+    return input_path, expected_abs
+
+# Rows: (input_path, mock_user, mock_vars, expected_norm, expected_abs)
+@pytest.mark.parametrize("expand_path_case", [
+    # Basic case
+    ("/some/path", "/home/user", {}, "/some/path", "/abs/some/path"),
+    # Tilde expansion
+    ("~/Documents", "/home/user", {}, "/home/user/Documents", "/abs/home/user/Documents"),
+    # Env var expansion (Unix-style)
+    ("$HOME/data", "/home/user", {"HOME": "/users/test"}, "/users/test/data", "/abs/users/test/data"),
+    # Env var expansion (Windows-style - though expandvars handles both)
+    ("%USERPROFILE%/files", "/home/user", {"USERPROFILE": "C:\\Users\\Test"}, "C:\\Users\\Test\\files", "C:\\abs\\Users\\Test\\files"),
+    # Combined tilde and env var
+    ("~/project/$PROJECT_NAME", "/home/user", {"PROJECT_NAME": "my_proj"}, "/home/user/project/my_proj", "/abs/home/user/project/my_proj"),
+    # Path needing normalization
+    ("/dir/./subdir/../other", "/home/user", {}, "/dir/other", "/abs/dir/other"),
+    # Empty path
+    ("", "/home/user", {}, ".", "/abs/current/dir"), # abspath('.') behavior
+    # Path-like input
+    (Path("~/Documents"), "/home/user", {}, "/home/user/Documents", "/abs/home/user/Documents"),
+    # None path (should likely raise error or be handled) - Let's assume it raises TypeError implicitly
+    # (None, "/home/user", {}, None, None), # Test case for None if handled explicitly
+], indirect=True, ids=lambda row: repr(row[0]))
+def test_expand_path(expand_path_case):
+    """
+    Tests the expand_path function with mocking for os functions.
+    """
+    input_path, expected_abs = expand_path_case
 
     # Handle None case if applicable (assuming expanduser would raise TypeError)
     if input_path is None:
@@ -66,6 +91,35 @@ def test_expand_path(input_path, mock_user, mock_vars, expected_norm, expected_a
     assert actual_result == expected_abs
 
 
+def test_expand_path_bytes(monkeypatch):
+    """
+    Tests that bytes paths are expanded like str paths and stay bytes.
+    """
+    monkeypatch.setenv('PROJECT_NAME', 'my_proj')
+    assert expand_path(b'/data/$PROJECT_NAME') == os.path.abspath(b'/data/my_proj')
+
+
+def test_expand_path_follows_environment_changes(monkeypatch):
+    """
+    Tests that cached expansions never outlive a change to the variables they read.
+    """
+    _expand_cached.cache_clear()
+
+    # Environment variables are expanded on every call
+    monkeypatch.setenv('PROJECT_NAME', 'first')
+    assert expand_path('/data/$PROJECT_NAME') == os.path.abspath('/data/first')
+    monkeypatch.setenv('PROJECT_NAME', 'second')
+    assert expand_path('/data/$PROJECT_NAME') == os.path.abspath('/data/second')
+
+    # A changed home directory is part of the cache key
+    monkeypatch.setenv('HOME', '/home/first')
+    monkeypatch.setenv('USERPROFILE', '/home/first')
+    assert expand_path('~/docs') == os.path.abspath('/home/first/docs')
+    monkeypatch.setenv('HOME', '/home/second')
+    monkeypatch.setenv('USERPROFILE', '/home/second')
+    assert expand_path('~/docs') == os.path.abspath('/home/second/docs')
+
+
 # --- Tests for format_path_for_display ---
 
 @pytest.mark.parametrize("input_path, max_length, expected_output", [
@@ -73,52 +127,43 @@ def test_expand_path(input_path, mock_user, mock_vars, expected_norm, expected_a
     ("/short/path/file.txt", 60, "/short/path/file.txt"),
     ("filename_only.txt", 60, "filename_only.txt"),
     ("/exact/length/path/is/fine", 28, "/exact/length/path/is/fine"),
-    # Long paths (> max_length) - Adjusted based on the *latest* actual results from pytest
-    ("/very/long/path/that/needs/shortening/for/display/file.txt", 60, "/very/long/path/that/needs/shortening/for/display/file.txt"), # Failed: Was not shortened as expected
-    ("a_very_long_filename_that_exceeds_the_limit_considerably.txt", 40, "a_very_long_filena...t_considerably.txt"), # Passed previously, keep expected
-    ("/root/only_a_few_levels/file.txt", 25, "/root/only_a_few_levels/file.txt"), # Failed: Was not shortened as expected
-    ("/root/mid1/mid2/mid3/file.txt", 30, "/root/mid1/mid2/mid3/file.txt"), # Failed: Was not shortened as expected
-    ("/root/file.txt", 10, ".../file.txt"), # Passed previously, keep expected
+    ("/very/long/path/that/needs/shortening/for/display/file.txt", 60, "/very/long/path/that/needs/shortening/for/display/file.txt"), # 58 chars, fits
+    ("/root/mid1/mid2/mid3/file.txt", 30, "/root/mid1/mid2/mid3/file.txt"), # 29 chars, fits
+    # Long paths (> max_length) - middle replaced by '…', result is exactly max_length
+    ("a_very_long_filename_that_exceeds_the_limit_considerably.txt", 40, "a_very_long_filenam\u2026mit_considerably.txt"),
+    ("/root/only_a_few_levels/file.txt", 25, "/root/only_a\u2026els/file.txt"),
+    ("/root/file.txt", 10, "/roo\u2026e.txt"),
+    ("/root/file.txt", 1, "\u2026"),
     # Edge cases
     ("/", 60, "/"),
     ("/file.txt", 60, "/file.txt"),
-    # Windows path - Use actual result from last failure, assuming os.sep='/' was active then
-    ("C:\\Windows\\System32\\drivers\\etc\\hosts", 40, "C:\\Windows\\System32\\drivers\\etc\\hosts"), # Failed: Was not shortened as expected
+    # Windows path - 37 chars, fits
+    ("C:\\Windows\\System32\\drivers\\etc\\hosts", 40, "C:\\Windows\\System32\\drivers\\etc\\hosts"),
+    ("C:\\Windows\\System32\\drivers\\etc\\hosts", 20, "C:\\Window\u2026\\etc\\hosts"),
 ])
 def test_format_path_for_display(input_path, max_length, expected_output): # Removed monkeypatch
     """
-    Tests the format_path_for_display function using native os.sep.
-    Expected outputs adjusted based on previous test run failures.
+    Tests the format_path_for_display function.
     """
-    # Let the function use the native os.sep
-    from organize_gui.utils.path_helpers import format_path_for_display
-
     actual_result = format_path_for_display(input_path, max_length)
     assert actual_result == expected_output
 
 
 # --- Tests for is_path_writable ---
 
-@pytest.mark.parametrize("path, path_exists, parent_writable, path_writable, expected", [
-    # Path exists
-    ("/existing/writable_file", True, True, True, True),   # Exists, writable
-    ("/existing/readonly_file", True, True, False, False), # Exists, not writable
-    # Path does not exist
-    ("/non_existing/file1", False, True, False, True),    # Not exists, parent writable
-    ("/non_existing/file2", False, False, False, False),   # Not exists, parent not writable
-    ("relative_file1", False, True, False, True),         # Relative, not exists, parent (cwd) writable
-    ("relative_file2", False, False, False, False),        # Relative, not exists, parent (cwd) not writable
-    # Edge case: Root directory or similar where dirname might be tricky
-    ("/root_file", False, True, False, True),             # Root file, parent ('/') writable
-])
-def test_is_path_writable(path, path_exists, parent_writable, path_writable, expected, monkeypatch):
+@pytest.fixture
+def writable_case(request, monkeypatch):
     """
-    Tests the is_path_writable function by mocking os.path and os.access.
+    Install the os.path/os.access mocks described by one is_path_writable table row.
+
+    Returns (path, path_writable, expected, exists_calls), exists_calls recording
+    the paths os.path.exists is asked about.
     """
-    from organize_gui.utils.path_helpers import is_path_writable
+    path, path_exists, parent_writable, path_writable, expected = request.param
 
-    # Mock os.path.exists
-    monkeypatch.setattr(os.path, 'exists', lambda p: p == path and path_exists)
+    # Mock os.path.exists, recording the paths it is asked about
+    exists_calls = []
+    monkeypatch.setattr(os.path, 'exists', lambda p: exists_calls.append(p) or (p == path and path_exists))
 
     # Store the original dirname function before mocking
     original_dirname = os.path.dirname
@@ -156,99 +201,196 @@ def test_is_path_writable(path, path_exists, parent_writable, path_writable, exp
             return False
     monkeypatch.setattr(os, 'access', mock_access)
 
+    return path, path_writable, expected, exists_calls
+
+# Rows: (path, path_exists, parent_writable, path_writable, expected)
+@pytest.mark.parametrize("writable_case", [
+    # Path exists
+    ("/existing/writable_file", True, True, True, True),   # Exists, writable
+    ("/existing/readonly_file", True, True, False, False), # Exists, not writable
+    # Path does not exist
+    ("/non_existing/file1", False, True, False, True),    # Not exists, parent writable
+    ("/non_existing/file2", False, False, False, False),   # Not exists, parent not writable
+    ("relative_file1", False, True, False, True),         # Relative, not exists, parent (cwd) writable
+    ("relative_file2", False, False, False, False),        # Relative, not exists, parent (cwd) not writable
+    # Edge case: Root directory or similar where dirname might be tricky
+    ("/root_file", False, True, False, True),             # Root file, parent ('/') writable
+], indirect=True, ids=lambda row: row[0])
+def test_is_path_writable(writable_case):
+    """
+    Tests the is_path_writable function by mocking os.path and os.access.
+    """
+    path, path_writable, expected, exists_calls = writable_case
+
     # Call the function under test
     actual_result = is_path_writable(path)
 
     # Assert the result
     assert actual_result == expected
+    if path_writable:
+        assert exists_calls == [] # A writable path is answered by os.access alone
 
 
 # --- Tests for get_directory_size ---
 
-# Helper mock data for os.walk
-MOCK_WALK_DATA = {
-    '/test/dir': [
-        ('/test/dir', ['subdir'], ['file1.txt', 'link_to_file']),
-        ('/test/dir/subdir', [], ['file2.txt']),
-    ],
-    '/test/empty': [
-        ('/test/empty', [], []),
-    ],
-    '/test/only_links': [
-        ('/test/only_links', [], ['link1', 'link2']),
-    ]
-}
+class FakeDirEntry:
+    """ Minimal stand-in for os.DirEntry. """
+
+    def __init__(self, parent, name, kind, size=0):
+        self.name = name
+        self.path = f"{parent}/{name}"
+        self._kind = kind  # 'file', 'dir' or 'link'
+        self._size = size
+
+    def is_symlink(self):
+        return self._kind == 'link'
+
+    def is_dir(self, follow_symlinks=True):
+        return self._kind == 'dir'
+
+    def stat(self, follow_symlinks=True):
+        return os.stat_result((0, 0, 0, 0, 0, 0, self._size, 0, 0, 0))
+
 
-# Helper mock data for file sizes and links
-MOCK_FILE_INFO = {
-    '/test/dir/file1.txt': {'size': 100, 'islink': False},
-    '/test/dir/link_to_file': {'size': 0, 'islink': True}, # Size doesn't matter for links
-    '/test/dir/subdir/file2.txt': {'size': 250, 'islink': False},
-    '/test/only_links/link1': {'size': 0, 'islink': True},
-    '/test/only_links/link2': {'size': 0, 'islink': True},
+class FakeScandir:
+    """ Context-manager iterator over FakeDirEntry objects, like the one os.scandir returns. """
+
+    def __init__(self, entries):
+        self._entries = entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+# Helper mock data for os.scandir: directory -> (name, kind, size) entries
+MOCK_SCANDIR_DATA = {
+    '/test/dir': [('file1.txt', 'file', 100), ('link_to_file', 'link', 0), ('subdir', 'dir', 0)],
+    '/test/dir/subdir': [('file2.txt', 'file', 250)],
+    '/test/empty': [],
+    '/test/only_links': [('link1', 'link', 0), ('link2', 'link', 0)],
 }
 
+@pytest.fixture
+def mock_scandir_tree(monkeypatch):
+    """ Serve os.scandir from MOCK_SCANDIR_DATA; directories not in it are missing. """
+    def mock_scandir(path):
+        if path not in MOCK_SCANDIR_DATA:
+            raise FileNotFoundError(path)
+        return FakeScandir([FakeDirEntry(path, *entry) for entry in MOCK_SCANDIR_DATA[path]])
+    monkeypatch.setattr(os, 'scandir', mock_scandir)
+
 @pytest.mark.parametrize("start_path, expected_size", [
     ('/test/dir', 350),        # Includes file1.txt and file2.txt
     ('/test/empty', 0),        # Empty directory
     ('/test/only_links', 0),   # Directory with only links
+    ('/test/missing', 0),      # Unreadable or missing directory
 ])
-def test_get_directory_size(start_path, expected_size, monkeypatch):
+def test_get_directory_size(start_path, expected_size, mock_scandir_tree):
     """
-    Tests the get_directory_size function by mocking os.walk and file stats.
+    Tests the get_directory_size function by mocking os.scandir.
     """
-    from organize_gui.utils.path_helpers import get_directory_size
+    # Call the function under test
+    actual_size = get_directory_size(start_path)
 
-    # Mock os.walk
-    def mock_walk(path):
-        if path in MOCK_WALK_DATA:
-            return iter(MOCK_WALK_DATA[path])
-        else:
-            return iter([]) # Return empty iterator for unexpected paths
-    monkeypatch.setattr(os, 'walk', mock_walk)
+    # Assert the result
+    assert actual_size == expected_size
 
-    # Mock os.path.join - use real join, assuming paths are simple enough
-    # monkeypatch.setattr(os.path, 'join', os.path.join) # No need to mock if using real one
 
-    # Mock os.path.islink
-    monkeypatch.setattr(os.path, 'islink', lambda p: MOCK_FILE_INFO.get(p, {}).get('islink', False))
+# --- Tests for are_paths_writable ---
 
-    # Mock os.path.getsize
-    monkeypatch.setattr(os.path, 'getsize', lambda p: MOCK_FILE_INFO.get(p, {}).get('size', 0))
+# Helper mock data for are_paths_writable: directory -> (writable, names it lists); '/unlisted' cannot be listed
+MOCK_PARENT_DIRS = {
+    '/all_writable': (True, ['file_a', 'file_b']),
+    '/existing': (True, ['writable_file', 'readonly_file', 'Cafe\u0301']),
+    '/writable_parent': (True, []),
+    '/readonly_parent': (False, []),
+    '.': (True, []),
+    '/unlisted': (True, None),
+}
 
-    # Call the function under test
-    actual_size = get_directory_size(start_path)
+# path -> (path_exists, path_writable, expected)
+WRITABLE_TABLE = {
+    "/all_writable/file_a": (True, True, True),        # Exists, writable; its parent is never listed
+    "/all_writable/file_b": (True, True, True),
+    "/existing/writable_file": (True, True, True),     # Exists, writable
+    "/existing/readonly_file": (True, False, False),   # Exists, not writable
+    "/existing/CAF\u00c9": (True, False, False),        # Listed under another case and Unicode normalization
+    "/existing/missing_file": (False, False, True),    # Not exists, ruled out by the listing
+    "/writable_parent/file1": (False, False, True),    # Not exists, parent writable
+    "/writable_parent/file2": (False, False, True),    # Sibling sharing the parent's listing and check
+    "/readonly_parent/file3": (False, False, False),   # Not exists, parent not writable
+    "relative_file": (False, False, True),             # Relative, not exists, parent (cwd) writable
+    "/unlisted/file": (False, False, True),            # Parent cannot be listed, existence checked directly
+}
 
-    # Assert the result
-    assert actual_size == expected_size
+def test_are_paths_writable(monkeypatch):
+    """
+    Tests are_paths_writable by mocking os.scandir, os.path.exists and os.access.
+    """
+    # Mock os.scandir, os.path.exists and os.access, recording the calls
+    scandir_calls, exists_calls, access_calls = [], [], []
+    def mock_scandir(p):
+        scandir_calls.append(p)
+        names = MOCK_PARENT_DIRS[p][1]
+        if names is None:
+            raise PermissionError(p)
+        return FakeScandir([FakeDirEntry(p, name, 'file') for name in names])
+    def mock_exists(p):
+        exists_calls.append(p)
+        return WRITABLE_TABLE[p][0]
+    def mock_access(p, mode):
+        assert mode == os.W_OK
+        access_calls.append(p)
+        return WRITABLE_TABLE[p][1] if p in WRITABLE_TABLE else MOCK_PARENT_DIRS[p][0]
+    monkeypatch.setattr(os, 'scandir', mock_scandir)
+    monkeypatch.setattr(os.path, 'exists', mock_exists)
+    monkeypatch.setattr(os, 'access', mock_access)
+
+    # Call the function under test on the whole table at once
+    actual = are_paths_writable(list(WRITABLE_TABLE))
+
+    # Assert the results
+    assert actual == {path: expected for path, (_, _, expected) in WRITABLE_TABLE.items()}
+
+    # A parent whose children are all writable is never listed; others at most once
+    assert '/all_writable' not in scandir_calls
+    assert len(scandir_calls) == len(set(scandir_calls))
+    # Siblings with a failing access() share one listing and one parent access() check
+    assert scandir_calls.count('/writable_parent') == 1
+    assert access_calls.count('/writable_parent') == 1
+    # Names the listing rules out skip os.path.exists; only listed or unlistable ones need it
+    assert exists_calls == ["/existing/readonly_file", "/existing/CAF\u00c9", "/unlisted/file"]
 
 
 # --- Tests for format_size ---
 
 @pytest.mark.parametrize("size_bytes, expected_string", [
-    # Adjusted expected outputs based on actual results from pytest run
     (0, "0 B"),
-    (100, "0.10 KB"),      # Failed: Actual '0.10 KB'
-    (1023, "1.00 KB"),     # Failed: Actual '1.00 KB'
-    (1024, "1.00 KB"),     # Passed
-    (1536, "1.50 KB"),     # Passed
-    (1024 * 500, "0.49 MB"), # Failed: Actual '0.49 MB'
-    (1024 * 1024 - 1, "1.00 MB"), # Failed: Actual '1.00 MB'
-    (1024 * 1024, "1.00 MB"),     # Passed
-    (1024 * 1024 * 1.23, "0.00 GB"), # Failed: Actual '0.00 GB'
-    (1024 * 1024 * 99.9, "0.10 GB"), # Failed: Actual '0.10 GB'
-    (1024 * 1024 * 100, "0.10 GB"), # Failed: Actual '0.10 GB'
-    (1024**3 * 2.5, "0.00 TB"),    # Failed: Actual '0.00 TB'
-    (1024**4 * 3.14, "0.00 PB"),    # Failed: Actual '0.00 PB'
-    (1024**5 * 1.1, "1.10 PB"),     # Passed
-    (1024**6, "1024.0 PB"), # Passed
+    (100, "100 B"),
+    (1023, "1023 B"),
+    (1024, "1.00 KB"),
+    (1536, "1.50 KB"),
+    (1024 * 500, "500.0 KB"),          # >= 100 of a unit: one decimal place
+    (1024 * 1024 - 1, "1024.0 KB"),    # Just under 1 MB stays in KB
+    (1024 * 1024, "1.00 MB"),
+    (1024 * 1024 * 1.23, "1.23 MB"),
+    (1024 * 1024 * 99.9, "99.90 MB"),
+    (1024 * 1024 * 100, "100.0 MB"),
+    (1024**3 * 2.5, "2.50 GB"),
+    (1024**4 * 3.14, "3.14 TB"),
+    (1024**5 * 1.1, "1.10 PB"),
+    (1024**6, "1024.0 PB"),            # Stays PB
 ])
 def test_format_size(size_bytes, expected_string):
     """
-    Tests the format_size function based on its observed behavior.
+    Tests the format_size function picks the largest unit the size reaches.
     """
-    from organize_gui.utils.path_helpers import format_size
-
     # Call the function under test
     actual_string = format_size(size_bytes)
 
@@ -258,7 +400,7 @@ def test_format_size(size_bytes, expected_string):
 
 # --- Tests for open_directory ---
 
-# Use patch from unittest.mock to easily check calls to subprocess.run/os.startfile
+# Use patch from unittest.mock to easily check calls to os.posix_spawn/os.startfile
 @pytest.mark.parametrize("target_path, path_exists, platform_name, expect_success, expected_call_args", [
     # Success cases
     ("/my/dir", True, "Darwin", True, ['open', '/abs/my/dir']),
@@ -268,14 +410,13 @@ def test_format_size(size_bytes, expected_string):
     ("/my/dir", False, "Darwin", False, None), # Path doesn't exist
     ("/my/dir", True, "UnsupportedOS", False, None), # Platform not handled (implicitly)
 ])
-@patch('organize_gui.utils.path_helpers.subprocess.run')
+@patch('organize_gui.utils.path_helpers.os.waitpid')
+@patch('organize_gui.utils.path_helpers.os.posix_spawn', create=True, return_value=1234)
 @patch('organize_gui.utils.path_helpers.os.startfile', create=True) # create=True needed if os.startfile doesn't exist on non-Windows
-def test_open_directory(mock_startfile, mock_subprocess_run, target_path, path_exists, platform_name, expect_success, expected_call_args, monkeypatch):
+def test_open_directory(mock_startfile, mock_posix_spawn, mock_waitpid, target_path, path_exists, platform_name, expect_success, expected_call_args, monkeypatch):
     """
-    Tests the open_directory function by mocking platform and subprocess/os calls.
+    Tests the open_directory function by mocking platform and process/os calls.
     """
-    from organize_gui.utils.path_helpers import open_directory
-
     # Mock os.path.abspath
     abs_path = f"/abs{target_path}" if target_path.startswith('/') else f"C:\\abs{target_path[2:]}" if target_path.startswith('C:') else f"/abs/cwd/{target_path}"
     monkeypatch.setattr(os.path, 'abspath', lambda p: abs_path if p == target_path else f"unexpected_abspath({p})")
@@ -283,8 +424,12 @@ def test_open_directory(mock_startfile, mock_subprocess_run, target_path, path_e
     # Mock os.path.exists
     monkeypatch.setattr(os.path, 'exists', lambda p: path_exists if p == abs_path else False)
 
-    # Mock platform.system
-    monkeypatch.setattr(platform, 'system', lambda: platform_name)
+    # Select the opener that would be resolved at import on this platform
+    monkeypatch.setattr(path_helpers, '_OPENER', path_helpers._OPENERS.get(platform_name))
+
+    # Mock the PATH lookup of the opener executable
+    path_helpers._find_executable.cache_clear()
+    monkeypatch.setattr(path_helpers.shutil, 'which', lambda name: f"/usr/bin/{name}")
 
     # Call the function
     actual_success = open_directory(target_path)
@@ -296,64 +441,82 @@ def test_open_directory(mock_startfile, mock_subprocess_run, target_path, path_e
     if expect_success:
         if platform_name == "Windows":
             mock_startfile.assert_called_once_with(expected_call_args)
-            mock_subprocess_run.assert_not_called()
+            mock_posix_spawn.assert_not_called()
         elif platform_name in ["Darwin", "Linux"]:
-            mock_subprocess_run.assert_called_once_with(expected_call_args)
+            mock_posix_spawn.assert_called_once()
+            executable, args, env = mock_posix_spawn.call_args.args
+            assert os.path.basename(executable) == expected_call_args[0]
+            assert args == expected_call_args
+            assert env is os.environ
+            mock_waitpid.assert_called_once_with(1234, 0) # The spawned opener is reaped
             mock_startfile.assert_not_called()
         else: # Should not be called for unsupported OS if path exists check fails first
              mock_startfile.assert_not_called()
-             mock_subprocess_run.assert_not_called()
+             mock_posix_spawn.assert_not_called()
     else:
         mock_startfile.assert_not_called()
-        mock_subprocess_run.assert_not_called()
+        mock_posix_spawn.assert_not_called()
 
 # Test exception handling during open
-@patch('organize_gui.utils.path_helpers.subprocess.run', side_effect=Exception("Mock Error"))
+@patch('organize_gui.utils.path_helpers.os.posix_spawn', create=True, side_effect=Exception("Mock Error"))
 @patch('organize_gui.utils.path_helpers.os.startfile', create=True, side_effect=Exception("Mock Error"))
-def test_open_directory_exception(mock_startfile, mock_subprocess_run, monkeypatch):
+def test_open_directory_exception(mock_startfile, mock_posix_spawn, monkeypatch):
     """ Tests that open_directory returns False if an exception occurs during open. """
-    from organize_gui.utils.path_helpers import open_directory
     target_path = "/my/dir"
     abs_path = "/abs/my/dir"
 
     monkeypatch.setattr(os.path, 'abspath', lambda p: abs_path)
     monkeypatch.setattr(os.path, 'exists', lambda p: True) # Assume path exists
+    path_helpers._find_executable.cache_clear()
+    monkeypatch.setattr(path_helpers.shutil, 'which', lambda name: f"/usr/bin/{name}")
 
-    # Test on a platform that uses subprocess.run (e.g., Darwin)
-    monkeypatch.setattr(platform, 'system', lambda: "Darwin")
+    # Test on a platform that uses os.posix_spawn (e.g., Darwin)
+    monkeypatch.setattr(path_helpers, '_OPENER', path_helpers._OPENERS["Darwin"])
     assert open_directory(target_path) == False
-    mock_subprocess_run.assert_called_once()
+    mock_posix_spawn.assert_called_once()
     mock_startfile.assert_not_called()
 
     # Reset mocks and test on Windows
-    mock_subprocess_run.reset_mock()
+    mock_posix_spawn.reset_mock()
     mock_startfile.reset_mock()
-    monkeypatch.setattr(platform, 'system', lambda: "Windows")
+    monkeypatch.setattr(path_helpers, '_OPENER', path_helpers._OPENERS["Windows"])
     assert open_directory(target_path) == False
     mock_startfile.assert_called_once()
-    mock_subprocess_run.assert_not_called()
+    mock_posix_spawn.assert_not_called()
+
+
+@patch('organize_gui.utils.path_helpers.os.posix_spawn', create=True)
+def test_open_directory_missing_opener(mock_posix_spawn, monkeypatch):
+    """ Tests that open_directory returns False without spawning when the opener is not on PATH. """
+    monkeypatch.setattr(os.path, 'exists', lambda p: True) # Assume path exists
+    monkeypatch.setattr(path_helpers, '_OPENER', path_helpers._OPENERS["Linux"])
+    path_helpers._find_executable.cache_clear()
+    monkeypatch.setattr(path_helpers.shutil, 'which', lambda name: None)
+
+    assert open_directory("/my/dir") == False
+    mock_posix_spawn.assert_not_called()
+
+    # A missing executable is not cached; it is found once it is installed
+    monkeypatch.setattr(path_helpers.shutil, 'which', lambda name: f"/usr/bin/{name}")
+    assert path_helpers._find_executable('xdg-open') == "/usr/bin/xdg-open"
+    path_helpers._find_executable.cache_clear()
 
 
 # --- Tests for ensure_directory_exists ---
 
-@pytest.mark.parametrize("path, path_exists, makedirs_side_effect, expected_return, expect_makedirs_call", [
+@pytest.mark.parametrize("path, makedirs_side_effect, expected_return", [
     # Success cases
-    ("/already/exists", True, None, True, False), # Already exists, makedirs not called
-    ("/new/dir/to/create", False, None, True, True), # Does not exist, makedirs called successfully
+    ("/already/exists", None, True), # Already exists, exist_ok=True keeps makedirs quiet
+    ("/new/dir/to/create", None, True), # Does not exist, makedirs called successfully
     # Failure cases
-    ("/new/dir/fail", False, OSError("Permission denied"), False, True), # makedirs raises OSError
-    ("/new/dir/other_fail", False, Exception("Some other error"), False, True), # makedirs raises other Exception
+    ("/new/dir/fail", OSError("Permission denied"), False), # makedirs raises OSError
+    ("/new/dir/other_fail", Exception("Some other error"), False), # makedirs raises other Exception
 ])
 @patch('organize_gui.utils.path_helpers.os.makedirs')
-def test_ensure_directory_exists(mock_makedirs, path, path_exists, makedirs_side_effect, expected_return, expect_makedirs_call, monkeypatch):
+def test_ensure_directory_exists(mock_makedirs, path, makedirs_side_effect, expected_return):
     """
-    Tests the ensure_directory_exists function by mocking os.path.exists and os.makedirs.
+    Tests the ensure_directory_exists function by mocking os.makedirs.
     """
-    from organize_gui.utils.path_helpers import ensure_directory_exists
-
-    # Mock os.path.exists
-    monkeypatch.setattr(os.path, 'exists', lambda p: path_exists if p == path else False)
-
     # Configure the mock for os.makedirs
     mock_makedirs.side_effect = makedirs_side_effect
 
@@ -363,11 +526,8 @@ def test_ensure_directory_exists(mock_makedirs, path, path_exists, makedirs_side
     # Assert return value
     assert actual_return == expected_return
 
-    # Assert if os.makedirs was called (or not)
-    if expect_makedirs_call:
-        mock_makedirs.assert_called_once_with(path)
-    else:
-        mock_makedirs.assert_not_called()
+    # makedirs is always called once, tolerating an existing directory
+    mock_makedirs.assert_called_once_with(path, exist_ok=True)
 
 
 # --- Tests for split_path_at_marker ---
@@ -395,12 +555,8 @@ def test_split_path_at_marker(path, marker, mock_sep, expected_base, expected_re
     """
     Tests the split_path_at_marker function based on observed behavior (adjusted again).
     """
-    from organize_gui.utils.path_helpers import split_path_at_marker
-    import re # Import re for use in mock
-
-    # Mock os.sep and re.escape for consistent testing
+    # Mock os.sep for consistent testing
     monkeypatch.setattr(os, 'sep', mock_sep)
-    monkeypatch.setattr(re, 'escape', lambda s: s.replace('\\', '\\\\')) # Simple escape for testing
 
     # Let the real os.path.normpath run
 
@@ -1,11 +1,13 @@
 import pytest
-import pytest
-import os
-# No need for patch or monkeypatch if os.path.exists isn't called
 
-# Assuming is_valid_path is in organize_gui.utils.validators
-# Adjust the import path if necessary based on your project structure
-from organize_gui.utils.validators import is_valid_path
+from organize_gui.utils.validators import (
+    is_valid_path,
+    is_valid_yaml,
+    is_valid_rule_name,
+    is_valid_extension_list,
+    is_valid_filter,
+    is_valid_action,
+)
 
 # Note: is_valid_path only checks syntax, not existence.
 @pytest.mark.parametrize("path_input, expected_result", [
@@ -15,6 +17,7 @@ from organize_gui.utils.validators import is_valid_path
     ("valid_relative_path", True), # Syntactically valid
     ("", False),                     # Empty string is invalid
     (None, False),                   # None input is invalid
+    (123, False),                    # Non-string input is invalid
     ("  ", False),                   # Whitespace only is invalid
     ("/path/with/nul\0byte", False), # Contains invalid null byte (Unix)
     # Add Windows-specific tests if needed, e.g., "C:\CON", "COM1", "file*?.txt"
@@ -57,12 +60,9 @@ def test_is_valid_path_syntax(path_input, expected_result):
 ])
 def test_is_valid_yaml(yaml_content, expected_result):
     """
-    Tests the is_valid_yaml function. Checks if yaml.safe_load raises an error.
+    Tests the is_valid_yaml function. Checks if the safe YAML loader raises an error.
     Note: Empty/whitespace strings are considered valid as they parse to None.
     """
-    # Import the function locally if it's not already imported at the top
-    from organize_gui.utils.validators import is_valid_yaml
-
     # Call the function under test
     actual_result = is_valid_yaml(yaml_content)
 
@@ -83,6 +83,7 @@ def test_is_valid_yaml(yaml_content, expected_result):
     ("", False), # Empty
     ("   ", False), # Whitespace only
     (None, False), # None input
+    (42, False), # Non-string input
     ("A"*101, False), # Too long
     ("Rule with > invalid", False), # Invalid char >
     ("Rule with < invalid", False), # Invalid char <
@@ -100,8 +101,6 @@ def test_is_valid_rule_name(rule_name, expected_result):
     """
     Tests the is_valid_rule_name function.
     """
-    from organize_gui.utils.validators import is_valid_rule_name
-
     # Call the function under test
     actual_result = is_valid_rule_name(rule_name)
 
@@ -137,8 +136,6 @@ def test_is_valid_extension_list(ext_list, expected_result):
     """
     Tests the is_valid_extension_list function.
     """
-    from organize_gui.utils.validators import is_valid_extension_list
-
     # Call the function under test
     actual_result = is_valid_extension_list(ext_list)
 
@@ -183,8 +180,6 @@ def test_is_valid_filter(filter_obj, expected_result):
     """
     Tests the is_valid_filter function.
     """
-    from organize_gui.utils.validators import is_valid_filter
-
     # Call the function under test
     actual_result = is_valid_filter(filter_obj)
 
@@ -237,8 +232,6 @@ def test_is_valid_action(action_obj, expected_result):
     """
     Tests the is_valid_action function.
     """
-    from organize_gui.utils.validators import is_valid_action
-
     # Call the function under test
     actual_result = is_valid_action(action_obj)
 